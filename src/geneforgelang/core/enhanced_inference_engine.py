@@ -16,6 +16,7 @@
 import logging
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
@@ -52,6 +53,24 @@ class PreTrainedTokenizer:
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to run models side by side in compare_models
+_MAX_COMPARE_WORKERS = 8
+
+
+def _collect_words(features: dict[str, Any], words: list[str]) -> None:
+    """Append the lower-cased words of every string nested in ``features``."""
+    # Depth-first with a stack of value iterators, so deep payloads cannot hit the recursion limit
+    stack = [iter(features.values())]
+    while stack:
+        for value in stack[-1]:
+            if isinstance(value, str):
+                words.extend(value.lower().split())
+            elif isinstance(value, dict):
+                stack.append(iter(value.values()))
+                break
+        else:
+            stack.pop()
+
 
 @dataclass
 class InferenceResult:
@@ -207,11 +226,11 @@ def predict(self, features: dict[str, Any]) -> InferenceResult:
     def _extract_text_features(self, features: dict[str, Any]) -> str:
         """Extract text content from features for analysis."""
         text_parts = []
-        for _key, value in features.items():
+        for value in features.values():
             if isinstance(value, str):
                 text_parts.append(value.lower())
             elif isinstance(value, dict):
-                text_parts.extend(self._extract_text_features(value).split())
+                _collect_words(value, text_parts)
         return " ".join(text_parts)
 
     def _apply_rule(
@@ -306,25 +325,30 @@ def load_model(self) -> None:
                 if self._tokenizer.pad_token is None:
                     self._tokenizer.pad_token = self._tokenizer.eos_token
 
+                # Half precision on GPU halves weight memory traffic for every model type
+                torch_dtype = torch.float16 if self._device.type == "cuda" else torch.float32
+
                 # Load model based on type
                 if self.config.model_type == "causal_lm":
                     self._model = AutoModelForCausalLM.from_pretrained(
                         self.config.model_name,
                         revision=self.config.revision,
                         trust_remote_code=False,
-                        torch_dtype=torch.float16 if self._device.type == "cuda" else torch.float32,
+                        torch_dtype=torch_dtype,
                     )
                 elif self.config.model_type == "sequence_classification":
                     self._model = AutoModelForSequenceClassification.from_pretrained(
                         self.config.model_name,
                         revision=self.config.revision,
                         trust_remote_code=False,
+                        torch_dtype=torch_dtype,
                     )
                 else:
                     self._model = AutoModel.from_pretrained(
                         self.config.model_name,
                         revision=self.config.revision,
                         trust_remote_code=False,
+                        torch_dtype=torch_dtype,
                     )
 
                 # Move to device
@@ -360,7 +384,7 @@ def predict(self, features: dict[str, Any]) -> InferenceResult:
                 inputs = {k: v.to(self._device) for k, v in inputs.items()}
 
                 # Make prediction
-                with torch.no_grad():
+                with torch.inference_mode():
                     outputs = self._model(**inputs)
 
                 # Process outputs based on model type
@@ -553,31 +577,41 @@ def predict(
             return result
 
     def batch_predict(
-        self, model_name: str | None, feature_list: list[dict[str, Any]]
+        self, model_name: str | None, feature_list: list[dict[str, Any]], explain: bool = False
     ) -> list[InferenceResult]:
         """Make batch predictions."""
-        return [self.predict(model_name, features, explain=False) for features in feature_list]
+        return [self.predict(model_name, features, explain=explain) for features in feature_list]
 
     def compare_models(
         self, features: dict[str, Any], model_names: list[str] | None = None
     ) -> dict[str, InferenceResult]:
         """Compare predictions across multiple models."""
-        model_names = model_names or list(self.models.keys())
-        results = {}
-
-        for model_name in model_names:
-            if model_name in self.models:
-                try:
-                    results[model_name] = self.predict(model_name, features)
-                except Exception as e:
-                    logger.error(f"Model {model_name} failed: {e}")
-                    results[model_name] = InferenceResult(
-                        prediction="error",
-                        confidence=0.0,
-                        explanation=f"Model failed: {e}",
-                    )
+        model_names = [name for name in model_names or self.models if name in self.models]
+
+        # Each model predicts independently and torch releases the GIL during
+        # inference, so transformer-backed comparisons can overlap on threads
+        if HAS_ML_DEPS and len(model_names) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_COMPARE_WORKERS, len(model_names))
+            ) as executor:
+                predictions = executor.map(
+                    lambda name: self._compare_predict(name, features), model_names
+                )
+                return dict(zip(model_names, predictions))
 
-        return results
+        return {name: self._compare_predict(name, features) for name in model_names}
+
+    def _compare_predict(self, model_name: str, features: dict[str, Any]) -> InferenceResult:
+        """Predict with one model, reporting failures as an error result."""
+        try:
+            return self.predict(model_name, features)
+        except Exception as e:
+            logger.error(f"Model {model_name} failed: {e}")
+            return InferenceResult(
+                prediction="error",
+                confidence=0.0,
+                explanation=f"Model failed: {e}",
+            )
 
     def get_model_info(self, model_name: str) -> dict[str, Any]:
         """Get information about a registered model."""
@@ -298,11 +298,21 @@ def hints(self) -> list[EnhancedValidationError]:
     @property
     def is_valid(self) -> bool:
         """True if no critical, semantic, or syntax errors."""
-        return (
-            len(self.critical_errors) == 0
-            and len(self.semantic_errors) == 0
-            and len(self.syntax_errors) == 0
-        )
+        if self._semantic_errors or self._syntax_errors:
+            return False
+        # Stop at the first blocking issue instead of building three filtered lists
+        for e in self.errors:
+            if e.severity == ErrorSeverity.CRITICAL:
+                return False
+            if (
+                self._semantic_errors is None
+                and e.severity == ErrorSeverity.ERROR
+                and e.category == ErrorCategory.SEMANTIC
+            ):
+                return False
+            if self._syntax_errors is None and e.category == ErrorCategory.SYNTAX:
+                return False
+        return True
 
     @property
     def has_warnings(self) -> bool:
@@ -315,14 +325,24 @@ def get_errors_by_category(self, category: ErrorCategory) -> list[EnhancedValida
 
     def get_statistics(self) -> dict[str, int]:
         """Get error statistics."""
-        return {
-            "critical": len(self.critical_errors),
-            "errors": len(self.semantic_errors),
-            "warnings": len(self.warnings),
-            "info": len(self.info_messages),
-            "hints": len(self.hints),
-            "total": len(self.errors),
+        # Tally every bucket in one pass over the errors
+        severity_keys = {
+            ErrorSeverity.CRITICAL: "critical",
+            ErrorSeverity.WARNING: "warnings",
+            ErrorSeverity.INFO: "info",
+            ErrorSeverity.HINT: "hints",
         }
+        stats = {"critical": 0, "errors": 0, "warnings": 0, "info": 0, "hints": 0}
+        for e in self.errors:
+            key = severity_keys.get(e.severity)
+            if key is not None:
+                stats[key] += 1
+            elif self._semantic_errors is None and e.category == ErrorCategory.SEMANTIC:
+                stats["errors"] += 1
+        if self._semantic_errors is not None:
+            stats["errors"] = len(self._semantic_errors)
+        stats["total"] = len(self.errors)
+        return stats
 
     def to_legacy_format(self) -> list[str]:
         """Convert to legacy string list format for backward compatibility."""
@@ -354,14 +374,19 @@ def __str__(self) -> str:
             lines.append("")
 
         # Group errors by severity
-        for severity in [
-            ErrorSeverity.CRITICAL,
-            ErrorSeverity.ERROR,
-            ErrorSeverity.WARNING,
-            ErrorSeverity.INFO,
-            ErrorSeverity.HINT,
-        ]:
-            severity_errors = [e for e in self.errors if e.severity == severity]
+        grouped: dict[ErrorSeverity, list[EnhancedValidationError]] = {
+            severity: []
+            for severity in [
+                ErrorSeverity.CRITICAL,
+                ErrorSeverity.ERROR,
+                ErrorSeverity.WARNING,
+                ErrorSeverity.INFO,
+                ErrorSeverity.HINT,
+            ]
+        }
+        for error in self.errors:
+            grouped[error.severity].append(error)
+        for severity, severity_errors in grouped.items():
             if severity_errors:
                 lines.append(f"{severity.value.upper()} ({len(severity_errors)}):")
                 for error in severity_errors:
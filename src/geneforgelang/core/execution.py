@@ -19,7 +19,6 @@ def execute_design_block(
         self, design_block: dict[str, Any], registry: PluginRegistry
     ) -> dict[str, Any]:
         """Execute a design block."""
-        print(design_block)
         model_name = design_block.get("model")
         if not model_name:
             raise ExecutionError("Design block missing 'model' parameter")
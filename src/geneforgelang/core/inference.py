@@ -1,12 +1,16 @@
+import copy
+from functools import lru_cache
 from typing import Any, Optional
 
-from geneforgelang.utils.prob_rules import ProbReasoner, default_rules
+from geneforgelang.utils.prob_rules import ProbReasoner, ProbRule, default_rules
 
 # Import enhanced inference capabilities
 try:
     from geneforgelang.core.enhanced_inference_engine import (
+        BaseMLModel,
         EnhancedInferenceEngine,
         InferenceResult,
+        ModelConfig,
         get_inference_engine,
     )
 
@@ -18,13 +22,67 @@
     get_inference_engine = None  # type: ignore
     InferenceResult = None  # type: ignore
 
+if HAS_ENHANCED_ENGINE:
+
+    class LegacyModelWrapper(BaseMLModel):
+        """Expose a legacy ``predict``-only model to the enhanced inference engine."""
+
+        def __init__(self, legacy_model):
+            config = ModelConfig(model_name="legacy_model", model_type="heuristic")
+            super().__init__(config)
+            self.legacy_model = legacy_model
+
+        def load_model(self):
+            self._model = self.legacy_model
+
+        def predict(self, features):
+            result = self.legacy_model.predict(features)
+            return InferenceResult(
+                prediction=result.get("label", "unknown"),
+                confidence=0.7,  # Default confidence for legacy models
+                explanation="Legacy model prediction",
+                raw_output=result,
+            )
+
+        def explain_prediction(self, features, result):
+            return "Legacy model - limited explanation available"
+
+
+# The 20 standard amino acids, appended to the heuristic protein seed
+_AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+# Legacy node types whose "val" attribute becomes a feature of the same name
+_CHILD_FEATURE_TYPES = frozenset({"target", "effect", "vector"})
+
+
+@lru_cache(maxsize=1)
+def _default_rule_templates() -> tuple[ProbRule, ...]:
+    """Build the default rule set once; engines take copies since rules are mutable."""
+    return tuple(default_rules())
+
+
+def _default_rules_copy() -> list[ProbRule]:
+    """Fresh default rules that share only their (immutable) condition callables."""
+    return [copy.copy(rule) for rule in _default_rule_templates()]
+
+
+def _feature_text(features: dict[str, Any]) -> str:
+    """Lowercased feature values joined into one string for keyword checks."""
+    return " ".join(str(value) for value in features.values()).lower()
+
+
+def _sub_block(block: dict[str, Any], key: str) -> dict[str, Any]:
+    """Return a nested block, or an empty dict when it is missing or not a mapping."""
+    value = block.get(key)
+    return value if isinstance(value, dict) else {}
+
 
 class InferenceEngine:
     """Inference engine with probabilistic rule layer."""
 
     def __init__(self, model):
         self.model = model
-        self.reasoner = ProbReasoner(default_rules())
+        self.reasoner = ProbReasoner(_default_rules_copy())
 
         # Enhanced inference engine integration
         if HAS_ENHANCED_ENGINE:
@@ -32,32 +90,6 @@ def __init__(self, model):
             # Register the legacy model if it has a predict method
             if hasattr(model, "predict"):
                 try:
-                    from geneforgelang.core.enhanced_inference_engine import (
-                        BaseMLModel,
-                        ModelConfig,
-                    )
-
-                    class LegacyModelWrapper(BaseMLModel):
-                        def __init__(self, legacy_model):
-                            config = ModelConfig(model_name="legacy_model", model_type="heuristic")
-                            super().__init__(config)
-                            self.legacy_model = legacy_model
-
-                        def load_model(self):
-                            self._model = self.legacy_model
-
-                        def predict(self, features):
-                            result = self.legacy_model.predict(features)
-                            return InferenceResult(
-                                prediction=result.get("label", "unknown"),
-                                confidence=0.7,  # Default confidence for legacy models
-                                explanation="Legacy model prediction",
-                                raw_output=result,
-                            )
-
-                        def explain_prediction(self, features, result):
-                            return "Legacy model - limited explanation available"
-
                     wrapper = LegacyModelWrapper(model)
                     self.enhanced_engine.register_model("legacy", wrapper)
                 except Exception:
@@ -84,6 +116,8 @@ def predict_effect(
             Dictionary with prediction results
         """
         features = self._extract_features(ast_dict)
+        # Both paths combine the model output with the same probabilistic reasoning
+        post = self.reasoner.posterior(ast_dict)
 
         # Try enhanced inference first if available and requested
         if enhanced and self.enhanced_engine:
@@ -91,36 +125,73 @@ def predict_effect(
                 model_name = model_name or "heuristic"  # Default to heuristic model
 
                 result = self.enhanced_engine.predict(model_name, features)
+                return self._combine_enhanced(result, post)
+
+            except Exception:
+                # Fall back to legacy inference if enhanced fails
+                pass
+
+        # Legacy inference path
+        return self._legacy_effect(features, post)
 
-                # Apply probabilistic reasoning to enhance the result
-                post = self.reasoner.posterior(dict(ast_dict))
+    def predict_effect_batch(
+        self,
+        ast_dicts: list[dict[str, Any]],
+        enhanced: bool = True,
+        model_name: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Predict genomic effects for several ASTs at once.
 
-                # Combine enhanced result with probabilistic reasoning
-                enhanced_confidence = (result.confidence + post["confidence"]) / 2
+        Features and posteriors are computed for every AST first, then the enhanced
+        engine is called once for the whole batch. If the enhanced model fails, the
+        whole batch falls back to the legacy path.
 
-                explanation_parts = [result.explanation]
-                if post["fired_rules"]:
-                    explanation_parts.append(f"Rules applied: {', '.join(post['fired_rules'])}")
+        Args:
+            ast_dicts: AST dictionaries containing experiment details
+            enhanced: Whether to use enhanced inference engine if available
+            model_name: Specific model to use ("heuristic", "legacy", etc.)
 
-                return {
-                    "label": (
-                        result.prediction
-                        if isinstance(result.prediction, str)
-                        else str(result.prediction)
-                    ),
-                    "confidence": enhanced_confidence,
-                    "explanation": ". ".join(explanation_parts),
-                    "enhanced_result": result.to_dict(),
-                    "probabilistic_reasoning": post,
-                }
+        Returns:
+            One prediction dictionary per AST, in the same order
+        """
+        features_list = [self._extract_features(ast_dict) for ast_dict in ast_dicts]
+        posts = [self.reasoner.posterior(ast_dict) for ast_dict in ast_dicts]
 
+        if enhanced and self.enhanced_engine:
+            try:
+                results = self.enhanced_engine.batch_predict(
+                    model_name or "heuristic", features_list, explain=True
+                )
+                return [self._combine_enhanced(result, post) for result, post in zip(results, posts)]
             except Exception:
                 # Fall back to legacy inference if enhanced fails
                 pass
 
-        # Legacy inference path
+        return [
+            self._legacy_effect(features, post) for features, post in zip(features_list, posts)
+        ]
+
+    def _combine_enhanced(self, result: Any, post: dict[str, Any]) -> dict[str, Any]:
+        """Combine an enhanced engine result with probabilistic reasoning."""
+        enhanced_confidence = (result.confidence + post["confidence"]) / 2
+
+        explanation_parts = [result.explanation]
+        if post["fired_rules"]:
+            explanation_parts.append(f"Rules applied: {', '.join(post['fired_rules'])}")
+
+        return {
+            "label": (
+                result.prediction if isinstance(result.prediction, str) else str(result.prediction)
+            ),
+            "confidence": enhanced_confidence,
+            "explanation": ". ".join(explanation_parts),
+            "enhanced_result": result.to_dict(),
+            "probabilistic_reasoning": post,
+        }
+
+    def _legacy_effect(self, features: dict[str, Any], post: dict[str, Any]) -> dict[str, Any]:
+        """Predict with the wrapped legacy model, scored by probabilistic reasoning."""
         base = self.model.predict(features)
-        post = self.reasoner.posterior(dict(ast_dict))  # best-effort copy
         return {
             "label": base.get("label", "unknown"),
             "confidence": post["confidence"],
@@ -132,10 +203,11 @@ def generate_protein(self, ast_dict: dict[str, Any]) -> dict[str, Any]:
 
         Uses enhanced inference engine if available, falls back to simple heuristic.
         """
+        features = self._extract_features(ast_dict)
+
         if self.enhanced_engine:
             try:
                 # Try to use protein generation model
-                features = self._extract_features(ast_dict)
                 result = self.enhanced_engine.predict("protein_generation", features)
 
                 return {
@@ -149,16 +221,16 @@ def generate_protein(self, ast_dict: dict[str, Any]) -> dict[str, Any]:
                 pass
 
         # Simple heuristic protein generation
-        features = self._extract_features(ast_dict)
         seed = "M"  # Default methionine start
 
-        if "kinase" in str(features).lower():
+        text = _feature_text(features)
+        if "kinase" in text:
             seed += "KKK"
-        if "nuclear" in str(features).lower():
+        if "nuclear" in text:
             seed += "RRR"
 
         return {
-            "sequence": seed + "ACDEFGHIKLMNPQRSTVWY"[:20],  # Simple sequence
+            "sequence": seed + _AMINO_ACIDS,  # Simple sequence
             "confidence": 0.3,
             "explanation": "Simple heuristic protein generation",
         }
@@ -192,7 +264,7 @@ def evaluate_off_target(self, ast_dict: dict[str, Any]) -> dict[str, Any]:
         features = self._extract_features(ast_dict)
 
         # Enhanced off-target evaluation if CRISPR is detected
-        if "crispr" in str(features).lower():
+        if "crispr" in _feature_text(features):
             return {
                 "off_target_hits": [],
                 "risk_score": 0.2,
@@ -216,31 +288,30 @@ def _extract_features(self, ast: dict[str, Any]) -> dict[str, Any]:
         children = ast.get("children") if isinstance(ast, dict) else None
         if isinstance(children, list):
             for n in children:
-                t = n.get("type") if isinstance(n, dict) else None
-                attrs = n.get("attrs", {}) if isinstance(n, dict) else {}
-                val = attrs.get("val")
-                if t == "target":
-                    feats["target"] = val
-                elif t == "effect":
-                    feats["effect"] = val
-                elif t == "vector":
-                    feats["vector"] = val
+                if isinstance(n, dict):
+                    t = n.get("type")
+                    if t in _CHILD_FEATURE_TYPES:
+                        feats[t] = n.get("attrs", {}).get("val")
             return feats
 
-        # YAML-like dict AST (top-level blocks)
-        def dig(d: Any, path: str, default: Any = None) -> Any:
-            cur = d
-            for p in path.split("."):
-                if not isinstance(cur, dict) or p not in cur:
-                    return default
-                cur = cur[p]
-            return cur
-
-        feats["experiment_tool"] = dig(ast, "experiment.tool")
-        feats["experiment_type"] = dig(ast, "experiment.type")
-        feats["strategy"] = dig(ast, "analyze.strategy") or dig(ast, "experiment.strategy")
-        feats["target_gene"] = dig(ast, "experiment.params.target_gene")
-        feats["p_value"] = dig(ast, "analyze.thresholds.p_value")
-        feats["log2fc"] = dig(ast, "analyze.thresholds.log2FoldChange")
-        feats["simulate"] = bool(ast.get("simulate")) if isinstance(ast, dict) else False
-        return {k: v for k, v in feats.items() if v is not None}
+        # YAML-like dict AST (top-level blocks); fetch each block once
+        if not isinstance(ast, dict):
+            return {"simulate": False}
+
+        experiment = _sub_block(ast, "experiment")
+        analyze = _sub_block(ast, "analyze")
+        thresholds = _sub_block(analyze, "thresholds")
+
+        # Keep only the features that are present, without a second filtering pass
+        for name, value in (
+            ("experiment_tool", experiment.get("tool")),
+            ("experiment_type", experiment.get("type")),
+            ("strategy", analyze.get("strategy") or experiment.get("strategy")),
+            ("target_gene", _sub_block(experiment, "params").get("target_gene")),
+            ("p_value", thresholds.get("p_value")),
+            ("log2fc", thresholds.get("log2FoldChange")),
+        ):
+            if value is not None:
+                feats[name] = value
+        feats["simulate"] = bool(ast.get("simulate"))
+        return feats
@@ -28,9 +28,10 @@ def parse_gfl(gfl_string: str) -> Optional[dict[str, Any]]:
     """
     with get_monitor().time_operation("gfl_parse"):
         try:
-            # Hash the input for cache key generation
-            input_hash = hashlib.sha256(gfl_string.encode()).hexdigest()[:16]
-            logger.debug(f"Parsing GFL content (hash: {input_hash})")
+            # The content hash is only for the debug log, so skip hashing when it is off
+            if logger.isEnabledFor(logging.DEBUG):
+                input_hash = hashlib.sha256(gfl_string.encode()).hexdigest()[:16]
+                logger.debug("Parsing GFL content (hash: %s)", input_hash)
 
             # Reject empty documents
             if len(gfl_string) == 0:
@@ -13,14 +13,26 @@
 import functools
 import hashlib
 import logging
+import math
 import pickle
 import time
 import weakref
 from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import nullcontext
 from dataclasses import dataclass
 from threading import Lock, RLock
 from typing import Any, Callable, Generic, TypeVar
 
+# Optional fast JSON encoder for building cache keys
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -56,25 +68,39 @@ def reset(self) -> None:
         self.evictions = 0
 
 
-@dataclass
 class CacheEntry(Generic[V]):
-    """Cache entry with metadata."""
+    """Cache entry with metadata.
 
-    value: V
-    created_at: float
-    last_accessed: float
-    access_count: int = 1
-    size: int = 0
+    Timestamps are ``time.monotonic_ns()`` readings: they are only compared
+    with each other, so they stay immune to wall-clock adjustments. Entries
+    use ``__slots__`` since a full cache holds one per key.
+    """
+
+    __slots__ = ("value", "created_at", "last_accessed", "access_count", "size")
+
+    def __init__(
+        self,
+        value: V,
+        created_at: int,
+        last_accessed: int,
+        access_count: int = 1,
+        size: int = 0,
+    ) -> None:
+        self.value = value
+        self.created_at = created_at
+        self.last_accessed = last_accessed
+        self.access_count = access_count
+        self.size = size
 
     def is_expired(self, ttl: float | None) -> bool:
         """Check if entry has expired."""
         if ttl is None:
             return False
-        return time.time() - self.created_at > ttl
+        return time.monotonic_ns() - self.created_at > ttl * 1_000_000_000
 
     def touch(self) -> None:
         """Update access metadata."""
-        self.last_accessed = time.time()
+        self.last_accessed = time.monotonic_ns()
         self.access_count += 1
 
 
@@ -137,7 +163,8 @@ def __init__(
         self.ttl = ttl
         self.enable_stats = enable_stats
         self._entries: dict[K, CacheEntry[V]] = {}
-        self._lock = RLock() if thread_safe else None
+        # nullcontext keeps the unlocked path free of per-call branching
+        self._lock = RLock() if thread_safe else nullcontext()
         self._stats = CacheStats() if enable_stats else None
 
         # Set up eviction policy
@@ -149,18 +176,9 @@ def __init__(
         else:
             self.eviction_policy = eviction_policy
 
-    def _with_lock(self, func: Callable) -> Any:
-        """Execute function with lock if thread safety is enabled."""
-        if self._lock:
-            with self._lock:
-                return func()
-        else:
-            return func()
-
     def get(self, key: K, default: V | None = None) -> V | None:
         """Get value from cache."""
-
-        def _get():
+        with self._lock:
             entry = self._entries.get(key)
 
             if entry is None:
@@ -184,20 +202,18 @@ def _get():
 
             return entry.value
 
-        return self._with_lock(_get)
-
     def put(self, key: K, value: V) -> None:
         """Put value in cache."""
-
-        def _put():
+        with self._lock:
             # Calculate approximate size
             size = self._estimate_size(value)
 
             # Create new entry
+            now = time.monotonic_ns()
             entry = CacheEntry(
                 value=value,
-                created_at=time.time(),
-                last_accessed=time.time(),
+                created_at=now,
+                last_accessed=now,
                 size=size,
             )
 
@@ -215,8 +231,6 @@ def _put():
                     self._stats.size += 1
                 self._stats.max_size = max(self._stats.max_size, len(self._entries))
 
-        self._with_lock(_put)
-
     def _evict_entries(self, count: int = 1) -> int:
         """Evict entries from cache."""
         evicted = 0
@@ -269,14 +283,11 @@ def _estimate_size(self, value: V) -> int:
 
     def clear(self) -> None:
         """Clear all cache entries."""
-
-        def _clear():
+        with self._lock:
             self._entries.clear()
             if self._stats:
                 self._stats.size = 0
 
-        self._with_lock(_clear)
-
     def size(self) -> int:
         """Get current cache size."""
         return len(self._entries)
@@ -287,8 +298,7 @@ def stats(self) -> CacheStats | None:
 
     def cleanup(self) -> int:
         """Remove expired entries and return count removed."""
-
-        def _cleanup():
+        with self._lock:
             expired_keys = [
                 key for key, entry in self._entries.items() if entry.is_expired(self.ttl)
             ]
@@ -300,8 +310,6 @@ def _cleanup():
 
             return len(expired_keys)
 
-        return self._with_lock(_cleanup)
-
 
 class LazyLoader(Generic[T]):
     """Lazy loader for expensive operations with caching."""
@@ -497,11 +505,39 @@ def wrapper(*args, **kwargs) -> T:
     return decorator
 
 
+_JSON_SCALAR_TYPES = (str, int, bool, type(None))
+
+
+def _is_plain_json(value: Any) -> bool:
+    """Check that a value is built only from exact JSON types.
+
+    orjson encodes tuples, enums, dataclasses, dates and non-finite floats like
+    other JSON values, so only values that cannot be confused that way may use it.
+    """
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return True
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is list:
+        return all(_is_plain_json(item) for item in value)
+    if value_type is dict:
+        return all(type(k) is str and _is_plain_json(v) for k, v in value.items())
+    return False
+
+
 def _create_cache_key(func_name: str, args: tuple, kwargs: dict) -> str:
     """Create a cache key from function arguments."""
+    # Create a hashable representation
+    key_data = (func_name, args, tuple(sorted(kwargs.items())))
+    if HAS_ORJSON and _is_plain_json(list(args)) and _is_plain_json(kwargs):
+        # orjson serializes plain dict/list/str arguments (ASTs, source text) far
+        # faster than pickle; anything it rejects falls through to pickle
+        try:
+            return hashlib.sha256(orjson.dumps(key_data)).hexdigest()
+        except TypeError:
+            pass
     try:
-        # Create a hashable representation
-        key_data = (func_name, args, tuple(sorted(kwargs.items())))
         key_str = pickle.dumps(key_data)
         return hashlib.sha256(key_str).hexdigest()
     except (TypeError, pickle.PicklingError):
@@ -526,7 +562,7 @@ class PerformanceMonitor:
     """Monitor performance metrics for GFL operations."""
 
     def __init__(self):
-        self._metrics: dict[str, list[float]] = {}
+        self._metrics: dict[str, deque[float]] = {}
         self._enabled = True
 
     def time_operation(self, operation_name: str):
@@ -538,14 +574,12 @@ def record_metric(self, name: str, value: float) -> None:
         if not self._enabled:
             return
 
-        if name not in self._metrics:
-            self._metrics[name] = []
-
-        self._metrics[name].append(value)
+        values = self._metrics.get(name)
+        if values is None:
+            # Keep only recent measurements (last 1000); the deque drops the oldest in O(1)
+            values = self._metrics[name] = deque(maxlen=1000)
 
-        # Keep only recent measurements (last 1000)
-        if len(self._metrics[name]) > 1000:
-            self._metrics[name] = self._metrics[name][-1000:]
+        values.append(value)
 
     def get_stats(self, operation_name: str) -> dict[str, float]:
         """Get statistics for an operation."""
@@ -556,12 +590,13 @@ def get_stats(self, operation_name: str) -> dict[str, float]:
         if not values:
             return {}
 
+        total = sum(values)
         return {
             "count": len(values),
             "min": min(values),
             "max": max(values),
-            "avg": sum(values) / len(values),
-            "total": sum(values),
+            "avg": total / len(values),
+            "total": total,
         }
 
     def get_all_stats(self) -> dict[str, dict[str, float]]:
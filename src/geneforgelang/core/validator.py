@@ -19,6 +19,116 @@
 
 logger = logging.getLogger(__name__)
 
+# Vocabularies checked on every validated block, built once at import time
+# Known tools (could be extended with a registry)
+_KNOWN_TOOLS = frozenset(
+    {
+        "CRISPR_cas9",
+        "CRISPR_cas12",
+        "CRISPR_base_editor",
+        "CRISPR_prime_editor",
+        "RNAseq",
+        "ChIPseq",
+        "ATACseq",
+        "WGS",
+        "WES",
+        "targeted_seq",
+    }
+)
+
+_VALID_EXPERIMENT_TYPES = frozenset(
+    {
+        "gene_editing",
+        "sequencing",
+        "analysis",
+        "simulation",
+        "validation",
+    }
+)
+
+_VALID_ANALYSIS_STRATEGIES = frozenset(
+    {
+        "differential",
+        "pathway",
+        "variant",
+        "expression",
+        "structural",
+        "functional",
+        "comparative",
+        "longitudinal",
+    }
+)
+
+_VALID_DESIGN_ENTITIES = frozenset(
+    {
+        "ProteinSequence",
+        "DNASequence",
+        "RNASequence",
+        "SmallMolecule",
+        "Peptide",
+        "Antibody",
+    }
+)
+
+# Known generative models (could be extended with a registry)
+_KNOWN_DESIGN_MODELS = frozenset(
+    {
+        "ProteinGeneratorVAE",
+        "DNADesignerGAN",
+        "MoleculeTransformer",
+        "SequenceOptimizer",
+        "StructurePredictor",
+    }
+)
+
+# Common metrics for different entity types
+_VALID_OBJECTIVE_METRICS = frozenset(
+    {
+        "binding_affinity",
+        "stability",
+        "solubility",
+        "toxicity",
+        "activity",
+        "selectivity",
+        "permeability",
+        "expression_level",
+    }
+)
+
+# Known optimization strategies
+_KNOWN_OPTIMIZATION_STRATEGIES = frozenset(
+    {
+        "ActiveLearning",
+        "BayesianOptimization",
+        "GeneticAlgorithm",
+        "SimulatedAnnealing",
+        "RandomSearch",
+        "GridSearch",
+    }
+)
+
+_VALID_BUDGET_CONSTRAINTS = frozenset(
+    {
+        "max_experiments",
+        "max_time",
+        "max_cost",
+        "convergence_threshold",
+    }
+)
+
+# Patterns checked once per AST node, compiled up front
+_IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+_ENTITY_REFERENCE_RE = re.compile(r"^([a-zA-Z_][a-zA-Z0-9_]*)\(([a-zA-Z_][a-zA-Z0-9_]*)\)$")
+_DURATION_RE = re.compile(r"^\d+[smhd]$")
+
+
+def _may_hold_injection(value: Any) -> bool:
+    """True for containers and strings that open a ${...} parameter injection."""
+    value_type = type(value)
+    return value_type is dict or value_type is list or (
+        value_type is str and value.startswith("${")
+    )
+
 
 class EnhancedSemanticValidator:
     """Enhanced semantic validator for GFL ASTs.
@@ -38,6 +148,22 @@ def __init__(self, file_path: Optional[str] = None):
         self.current_block: Optional[str] = None
         self.nested_level = 0
         self.schema_loader = get_global_schema_loader()
+        # Validator for each top-level block; pathways and complexes are validated
+        # while their definitions are collected
+        self._block_validators = {
+            "experiment": self._validate_experiment_block,
+            "analyze": self._validate_analysis_block,
+            "design": self._validate_design_block,
+            "optimize": self._validate_optimize_block,
+            "simulate": self._validate_simulate_block,
+            "branch": self._validate_branch_block,
+            "refine_data": self._validate_refine_data_block,
+            "guided_discovery": self._validate_guided_discovery_block,
+            "metadata": self._validate_metadata_block,
+            "rules": self._validate_rules_block,
+            "hypothesis": self._validate_hypothesis_block,
+            "timeline": self._validate_timeline_block,
+        }
 
     def validate_ast(self, ast: dict[str, Any]) -> EnhancedValidationResult:
         """Validate a GFL AST and return enhanced validation result.
@@ -172,56 +298,33 @@ def _validate_blocks(self, ast: dict[str, Any]) -> None:
         # Collect hypothesis definitions for reference validation
         self._collect_hypothesis_definitions(ast)
 
+        block_validators = self._block_validators
         for block_name, block_content in ast.items():
             self.current_block = block_name
 
-            if block_name == "experiment":
-                self._validate_experiment_block(block_content)
-                # Store contract for compatibility checking
-                if isinstance(block_content, dict) and "contract" in block_content:
-                    self._store_block_contract(block_name, block_content["contract"])
-            elif block_name == "analyze":
-                self._validate_analysis_block(block_content)
-                # Store contract for compatibility checking
-                if isinstance(block_content, dict) and "contract" in block_content:
-                    self._store_block_contract(block_name, block_content["contract"])
-            elif block_name == "design":
-                self._validate_design_block(block_content)
-            elif block_name == "optimize":
-                self._validate_optimize_block(block_content)
-            elif block_name == "simulate":
-                self._validate_simulate_block(block_content)
-            elif block_name == "branch":
-                self._validate_branch_block(block_content)
-            elif block_name == "refine_data":
-                self._validate_refine_data_block(block_content)
-            elif block_name == "guided_discovery":
-                self._validate_guided_discovery_block(block_content)
-            elif block_name == "metadata":
-                self._validate_metadata_block(block_content)
-            elif block_name == "rules":
-                self._validate_rules_block(block_content)
-            elif block_name == "hypothesis":
-                self._validate_hypothesis_block(block_content)
-            elif block_name == "timeline":
-                self._validate_timeline_block(block_content)
-            elif block_name == "pathways":
-                # Pathways are validated during collection
-                pass
-            elif block_name == "complexes":
-                # Complexes are validated during collection
-                pass
+            validate_block = block_validators.get(block_name)
+            if validate_block is None:
+                continue
+            validate_block(block_content)
+
+            # Store contract for compatibility checking
+            if (
+                block_name in ("experiment", "analyze")
+                and isinstance(block_content, dict)
+                and "contract" in block_content
+            ):
+                self._store_block_contract(block_name, block_content["contract"])
 
     def _collect_entity_definitions(self, ast: dict[str, Any]) -> None:
         """Collect pathway and complex definitions for reference validation."""
         self.entity_registry = {}
 
-        # Debug: Print AST
-        print(f"AST keys: {list(ast.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("AST keys: %s", list(ast.keys()))
 
         # Collect pathways
         if "pathways" in ast:
-            print("Found pathways in AST")
+            logger.debug("Found pathways in AST")
             pathways = ast["pathways"]
             if not isinstance(pathways, dict):
                 self.result.add_error(
@@ -240,7 +343,7 @@ def _collect_entity_definitions(self, ast: dict[str, Any]) -> None:
 
         # Collect complexes
         if "complexes" in ast:
-            print("Found complexes in AST")
+            logger.debug("Found complexes in AST")
             complexes = ast["complexes"]
             if not isinstance(complexes, dict):
                 self.result.add_error(
@@ -257,14 +360,22 @@ def _collect_entity_definitions(self, ast: dict[str, Any]) -> None:
                             ErrorCodes.SEMANTIC_INVALID_FIELD_TYPE,
                         ).add_fix(f"Format complex '{complex_name}' as a dictionary")
 
-        # Debug: Print entity registry contents
-        print(f"Collected entity registry: {self.entity_registry}")
+        logger.debug("Collected entity registry: %s", self.entity_registry)
 
-    def _validate_entity_reference(self, entity_ref: str) -> None:
-        """Validate entity reference in parameter values."""
+    def _validate_entity_reference(
+        self, entity_ref: str, match: Optional[re.Match[str]] = None
+    ) -> None:
+        """Validate entity reference in parameter values.
+
+        Args:
+            entity_ref: The reference string, e.g. ``pathway(UreaCycle)``.
+            match: The reference's ``_ENTITY_REFERENCE_RE`` match, when the caller has
+                already matched it.
+        """
 
         # Extract entity type and name
-        match = re.match(r"^([a-zA-Z_][a-zA-Z0-9_]*)\(([a-zA-Z_][a-zA-Z0-9_]*)\)$", entity_ref)
+        if match is None:
+            match = _ENTITY_REFERENCE_RE.match(entity_ref)
         if not match:
             self.result.add_error(
                 f"Invalid entity reference format: {entity_ref}",
@@ -285,21 +396,18 @@ def _validate_entity_reference(self, entity_ref: str) -> None:
 
         # Check if entity is defined
         if hasattr(self, "entity_registry"):
-            # Debug: Print entity registry contents
-            print(f"Entity registry: {self.entity_registry}")
-            print(f"Looking for entity type: {entity_type}")
-            print(f"Looking for entity name: {entity_name}")
+            logger.debug("Looking up %s '%s' in %s", entity_type, entity_name, self.entity_registry)
 
             registry_key = entity_type + "s"  # "pathway" -> "pathways", "complex" -> "complexes"
             # Fix for complex -> complexes
             if entity_type == "complex":
                 registry_key = "complexes"
-            print(f"Registry key: {registry_key}")
             if registry_key in self.entity_registry:
-                print(f"Found registry key: {registry_key}")
-                print(f"Available entities: {list(self.entity_registry[registry_key].keys())}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Available %s: %s", registry_key, list(self.entity_registry[registry_key])
+                    )
                 if entity_name in self.entity_registry[registry_key]:
-                    print(f"Found entity: {entity_name}")
                     return  # Valid reference
                 else:
                     self.result.add_error(
@@ -804,28 +912,14 @@ def _validate_tool_field(self, tool: Any) -> None:
             error.add_fix("Change tool to a string value like 'CRISPR_cas9'")
             return
 
-        # Known tools (could be extended with a registry)
-        known_tools = {
-            "CRISPR_cas9",
-            "CRISPR_cas12",
-            "CRISPR_base_editor",
-            "CRISPR_prime_editor",
-            "RNAseq",
-            "ChIPseq",
-            "ATACseq",
-            "WGS",
-            "WES",
-            "targeted_seq",
-        }
-
-        if tool not in known_tools:
+        if tool not in _KNOWN_TOOLS:
             error = self.result.add_error(
                 f"Unknown tool '{tool}'",
                 ErrorCodes.SEMANTIC_UNKNOWN_TOOL,
                 ErrorSeverity.WARNING,
             )
             error.add_fix(f"Use a known tool or ensure '{tool}' plugin is available")
-            error.add_context("suggested_tools", list(known_tools))
+            error.add_context("suggested_tools", list(_KNOWN_TOOLS))
 
     def _validate_experiment_type(self, exp_type: Any) -> None:
         """Validate the experiment type."""
@@ -837,22 +931,14 @@ def _validate_experiment_type(self, exp_type: Any) -> None:
             error.add_fix("Change type to a string like 'gene_editing'")
             return
 
-        valid_types = {
-            "gene_editing",
-            "sequencing",
-            "analysis",
-            "simulation",
-            "validation",
-        }
-
-        if exp_type not in valid_types:
+        if exp_type not in _VALID_EXPERIMENT_TYPES:
             error = self.result.add_error(
                 f"Unknown experiment type '{exp_type}'",
                 ErrorCodes.SEMANTIC_INVALID_PARAMETER,
                 ErrorSeverity.WARNING,
             )
-            error.add_fix(f"Use one of: {', '.join(valid_types)}")
-            error.add_context("valid_types", list(valid_types))
+            error.add_fix(f"Use one of: {', '.join(_VALID_EXPERIMENT_TYPES)}")
+            error.add_context("valid_types", list(_VALID_EXPERIMENT_TYPES))
 
     def _validate_experiment_params(self, params: Any) -> None:
         """Validate experiment parameters."""
@@ -882,9 +968,11 @@ def _validate_experiment_params(self, params: Any) -> None:
                 continue
 
             # Check for entity references (e.g., pathway(UreaCycle))
-            if isinstance(param_value, str) and self._is_entity_reference(param_value):
-                self._validate_entity_reference(param_value)
-                continue
+            if isinstance(param_value, str):
+                match = _ENTITY_REFERENCE_RE.match(param_value)
+                if match:
+                    self._validate_entity_reference(param_value, match)
+                    continue
 
             if param_name in type_validations:
                 expected_types = type_validations[param_name]
@@ -905,68 +993,7 @@ def _is_entity_reference(self, value: str) -> bool:
         """Check if a string value is an entity reference (e.g., pathway(UreaCycle))."""
 
         # Pattern for entity references: entity_type(entity_name)
-        pattern = r"^[a-zA-Z_][a-zA-Z0-9_]*\([a-zA-Z_][a-zA-Z0-9_]*\)$"
-        return bool(re.match(pattern, value))
-
-    def _validate_entity_reference(self, entity_ref: str) -> None:
-        """Validate entity reference in parameter values."""
-
-        # Extract entity type and name
-        match = re.match(r"^([a-zA-Z_][a-zA-Z0-9_]*)\(([a-zA-Z_][a-zA-Z0-9_]*)\)$", entity_ref)
-        if not match:
-            self.result.add_error(
-                f"Invalid entity reference format: {entity_ref}",
-                ErrorCodes.SEMANTIC_INVALID_PARAMETER,
-            ).add_fix("Use format 'entity_type(entity_name)' for entity references")
-            return
-
-        entity_type, entity_name = match.groups()
-
-        # Check if entity type is supported
-        supported_entity_types = {"pathway", "complex"}
-        if entity_type not in supported_entity_types:
-            self.result.add_error(
-                f"Unsupported entity type '{entity_type}' in reference: {entity_ref}",
-                ErrorCodes.SEMANTIC_INVALID_PARAMETER,
-            ).add_fix(f"Use one of the supported entity types: {', '.join(supported_entity_types)}")
-            return
-
-        # Check if entity is defined
-        if hasattr(self, "entity_registry"):
-            # Debug: Print entity registry contents
-            print(f"Entity registry: {self.entity_registry}")
-            print(f"Looking for entity type: {entity_type}")
-            print(f"Looking for entity name: {entity_name}")
-
-            registry_key = entity_type + "s"  # "pathway" -> "pathways", "complex" -> "complexes"
-            # Fix for complex -> complexes
-            if entity_type == "complex":
-                registry_key = "complexes"
-            print(f"Registry key: {registry_key}")
-            if registry_key in self.entity_registry:
-                print(f"Found registry key: {registry_key}")
-                print(f"Available entities: {list(self.entity_registry[registry_key].keys())}")
-                if entity_name in self.entity_registry[registry_key]:
-                    print(f"Found entity: {entity_name}")
-                    return  # Valid reference
-                else:
-                    self.result.add_error(
-                        f"Referenced {entity_type} '{entity_name}' is not defined",
-                        ErrorCodes.SEMANTIC_UNDEFINED_ENTITY_REFERENCE,
-                    ).add_fix(
-                        f"Define a {entity_type} with name '{entity_name}' or reference an existing one"
-                    )
-            else:
-                # Entity type registry doesn't exist
-                self.result.add_error(
-                    f"Referenced {entity_type} '{entity_name}' is not defined (no {entity_type} definitions found)",
-                    ErrorCodes.SEMANTIC_UNDEFINED_ENTITY_REFERENCE,
-                ).add_fix(f"Add a {entity_type} definition section or reference an existing one")
-        else:
-            self.result.add_error(
-                f"Referenced {entity_type} '{entity_name}' is not defined (no entity definitions found)",
-                ErrorCodes.SEMANTIC_UNDEFINED_ENTITY_REFERENCE,
-            ).add_fix("Add entity definitions or reference an existing one")
+        return bool(_ENTITY_REFERENCE_RE.match(value))
 
     def _validate_tool_type_compatibility(self, tool: str, exp_type: str) -> None:
         """Validate tool and type compatibility."""
@@ -1027,25 +1054,14 @@ def _validate_analysis_strategy(self, strategy: Any) -> None:
             ).add_fix("Use a string like 'differential' for the strategy")
             return
 
-        valid_strategies = {
-            "differential",
-            "pathway",
-            "variant",
-            "expression",
-            "structural",
-            "functional",
-            "comparative",
-            "longitudinal",
-        }
-
-        if strategy not in valid_strategies:
+        if strategy not in _VALID_ANALYSIS_STRATEGIES:
             error = self.result.add_error(
                 f"Unknown analysis strategy '{strategy}'",
                 ErrorCodes.SEMANTIC_UNKNOWN_STRATEGY,
                 ErrorSeverity.WARNING,
             )
-            error.add_fix(f"Use one of: {', '.join(sorted(valid_strategies))}")
-            error.add_context("valid_strategies", list(valid_strategies))
+            error.add_fix(f"Use one of: {', '.join(sorted(_VALID_ANALYSIS_STRATEGIES))}")
+            error.add_context("valid_strategies", list(_VALID_ANALYSIS_STRATEGIES))
 
     def _validate_design_block(self, design: Any) -> None:
         """Validate design block structure and content."""
@@ -1159,23 +1175,14 @@ def _validate_design_entity(self, entity: Any) -> None:
             ).add_fix("Use a string like 'ProteinSequence' for the entity")
             return
 
-        valid_entities = {
-            "ProteinSequence",
-            "DNASequence",
-            "RNASequence",
-            "SmallMolecule",
-            "Peptide",
-            "Antibody",
-        }
-
-        if entity not in valid_entities:
+        if entity not in _VALID_DESIGN_ENTITIES:
             error = self.result.add_error(
                 f"Unknown design entity '{entity}'",
                 ErrorCodes.SEMANTIC_INVALID_PARAMETER,
                 ErrorSeverity.WARNING,
             )
-            error.add_fix(f"Use one of: {', '.join(sorted(valid_entities))}")
-            error.add_context("valid_entities", list(valid_entities))
+            error.add_fix(f"Use one of: {', '.join(sorted(_VALID_DESIGN_ENTITIES))}")
+            error.add_context("valid_entities", list(_VALID_DESIGN_ENTITIES))
 
     def _validate_design_model(self, model: Any) -> None:
         """Validate the model field in design block."""
@@ -1186,23 +1193,14 @@ def _validate_design_model(self, model: Any) -> None:
             ).add_fix("Use a string like 'ProteinGeneratorVAE' for the model")
             return
 
-        # Known generative models (could be extended with a registry)
-        known_models = {
-            "ProteinGeneratorVAE",
-            "DNADesignerGAN",
-            "MoleculeTransformer",
-            "SequenceOptimizer",
-            "StructurePredictor",
-        }
-
-        if model not in known_models:
+        if model not in _KNOWN_DESIGN_MODELS:
             error = self.result.add_error(
                 f"Unknown generative model '{model}'",
                 ErrorCodes.SEMANTIC_UNKNOWN_TOOL,
                 ErrorSeverity.WARNING,
             )
             error.add_fix(f"Ensure '{model}' plugin is available or use a known model")
-            error.add_context("suggested_models", list(known_models))
+            error.add_context("suggested_models", list(_KNOWN_DESIGN_MODELS))
 
     def _validate_design_objective(self, objective: Any) -> None:
         """Validate the objective field in design block."""
@@ -1246,26 +1244,14 @@ def _validate_objective_metric(self, metric: Any, direction: str) -> None:
             ).add_fix(f"Use a string like 'binding_affinity' for {direction}")
             return
 
-        # Common metrics for different entity types
-        valid_metrics = {
-            "binding_affinity",
-            "stability",
-            "solubility",
-            "toxicity",
-            "activity",
-            "selectivity",
-            "permeability",
-            "expression_level",
-        }
-
-        if metric not in valid_metrics:
+        if metric not in _VALID_OBJECTIVE_METRICS:
             error = self.result.add_error(
                 f"Unknown objective metric '{metric}'",
                 ErrorCodes.SEMANTIC_INVALID_PARAMETER,
                 ErrorSeverity.WARNING,
             )
-            error.add_fix(f"Use one of: {', '.join(sorted(valid_metrics))}")
-            error.add_context("valid_metrics", list(valid_metrics))
+            error.add_fix(f"Use one of: {', '.join(sorted(_VALID_OBJECTIVE_METRICS))}")
+            error.add_context("valid_metrics", list(_VALID_OBJECTIVE_METRICS))
 
     def _validate_design_count(self, count: Any) -> None:
         """Validate the count field in design block."""
@@ -1301,7 +1287,7 @@ def _validate_design_output(self, output: Any) -> None:
             return
 
         # Validate identifier format
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", output):
+        if not _IDENTIFIER_RE.match(output):
             error = self.result.add_error(
                 f"Invalid output identifier '{output}'",
                 ErrorCodes.SEMANTIC_INVALID_PARAMETER,
@@ -1419,7 +1405,7 @@ def _validate_search_space_parameter(self, param_name: str, param_def: Any) -> N
             return
 
         # Validate parameter name format
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", param_name):
+        if not _IDENTIFIER_RE.match(param_name):
             error = self.result.add_error(
                 f"Invalid parameter name '{param_name}'",
                 ErrorCodes.SEMANTIC_INVALID_PARAMETER,
@@ -1548,24 +1534,14 @@ def _validate_optimize_strategy(self, strategy: Any) -> None:
             ).add_fix("Use a string like 'ActiveLearning' for strategy name")
             return
 
-        # Known optimization strategies
-        known_strategies = {
-            "ActiveLearning",
-            "BayesianOptimization",
-            "GeneticAlgorithm",
-            "SimulatedAnnealing",
-            "RandomSearch",
-            "GridSearch",
-        }
-
-        if strategy_name not in known_strategies:
+        if strategy_name not in _KNOWN_OPTIMIZATION_STRATEGIES:
             error = self.result.add_error(
                 f"Unknown optimization strategy '{strategy_name}'",
                 ErrorCodes.SEMANTIC_UNKNOWN_TOOL,
                 ErrorSeverity.WARNING,
             )
-            error.add_fix(f"Use one of: {', '.join(sorted(known_strategies))}")
-            error.add_context("available_strategies", list(known_strategies))
+            error.add_fix(f"Use one of: {', '.join(sorted(_KNOWN_OPTIMIZATION_STRATEGIES))}")
+            error.add_context("available_strategies", list(_KNOWN_OPTIMIZATION_STRATEGIES))
 
         # Special validation for ActiveLearning strategy
         if strategy_name == "ActiveLearning":
@@ -1688,22 +1664,15 @@ def _validate_optimize_budget(self, budget: Any) -> None:
             return
 
         # Validate budget constraints
-        valid_constraints = {
-            "max_experiments",
-            "max_time",
-            "max_cost",
-            "convergence_threshold",
-        }
-
         for constraint, value in budget.items():
-            if constraint not in valid_constraints:
+            if constraint not in _VALID_BUDGET_CONSTRAINTS:
                 error = self.result.add_error(
                     f"Unknown budget constraint '{constraint}'",
                     ErrorCodes.SEMANTIC_INVALID_PARAMETER,
                     ErrorSeverity.WARNING,
                 )
-                error.add_fix(f"Use one of: {', '.join(sorted(valid_constraints))}")
-                error.add_context("valid_constraints", list(valid_constraints))
+                error.add_fix(f"Use one of: {', '.join(sorted(_VALID_BUDGET_CONSTRAINTS))}")
+                error.add_context("valid_constraints", list(_VALID_BUDGET_CONSTRAINTS))
 
             # Validate constraint values
             if constraint == "max_experiments":
@@ -1723,7 +1692,7 @@ def _validate_optimize_budget(self, budget: Any) -> None:
                 else:
                     # Validate time format
 
-                    if not re.match(r"^\d+[smhd]$", value):
+                    if not _DURATION_RE.match(value):
                         error = self.result.add_error(
                             f"Budget constraint '{constraint}' has invalid time format: {value}",
                             ErrorCodes.SEMANTIC_INVALID_PARAMETER,
@@ -1776,37 +1745,45 @@ def _validate_optimize_run(self, run: Any) -> None:
 
     def _validate_parameter_injection(self, block: dict) -> None:
         """Validate ${...} parameter injection syntax in nested blocks."""
-        # Recursively check all values in the block for parameter injection
-        self._check_parameter_injection_recursive(block, "")
-
-    def _check_parameter_injection_recursive(self, obj: Any, path: str) -> None:
-        """Recursively check for parameter injection patterns."""
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                new_path = f"{path}.{key}" if path else key
-                self._check_parameter_injection_recursive(value, new_path)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                new_path = f"{path}[{i}]" if path else f"[{i}]"
-                self._check_parameter_injection_recursive(item, new_path)
-        elif isinstance(obj, str) and obj.startswith("${") and obj.endswith("}"):
-            # This is a parameter injection - validate the parameter name
-            param_name = obj[2:-1]  # Remove ${}
-            if not param_name:
-                error = self.result.add_error(
-                    f"Empty parameter injection at {path}",
-                    ErrorCodes.SEMANTIC_INVALID_PARAMETER,
-                )
-                error.add_fix("Specify a parameter name like ${parameter_name}")
-            else:
-                # Validate parameter name format
-
-                if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", param_name):
-                    error = self.result.add_error(
-                        f"Invalid parameter name '{param_name}' in injection at {path}",
-                        ErrorCodes.SEMANTIC_INVALID_PARAMETER,
-                    )
-                    error.add_fix("Use valid identifier like ${valid_param_name}")
+        # Walk the block with an explicit stack in the same depth-first order as a
+        # recursive walk. ASTs only hold plain dicts, lists and scalars, so exact type
+        # checks suffice, and a path is only built for values that can hold an injection.
+        stack: list[tuple[Any, str]] = [(block, "")] if _may_hold_injection(block) else []
+        while stack:
+            obj, path = stack.pop()
+            obj_type = type(obj)
+            if obj_type is dict:
+                children = [
+                    (value, f"{path}.{key}" if path else key)
+                    for key, value in obj.items()
+                    if _may_hold_injection(value)
+                ]
+                stack.extend(reversed(children))
+            elif obj_type is list:
+                children = [
+                    (item, f"{path}[{i}]" if path else f"[{i}]")
+                    for i, item in enumerate(obj)
+                    if _may_hold_injection(item)
+                ]
+                stack.extend(reversed(children))
+            elif obj.endswith("}"):
+                # This is a parameter injection - validate the parameter name
+                self._check_injected_parameter(obj[2:-1], path)
+
+    def _check_injected_parameter(self, param_name: str, path: str) -> None:
+        """Validate the parameter name of a single ${...} injection."""
+        if not param_name:
+            error = self.result.add_error(
+                f"Empty parameter injection at {path}",
+                ErrorCodes.SEMANTIC_INVALID_PARAMETER,
+            )
+            error.add_fix("Specify a parameter name like ${parameter_name}")
+        elif not _IDENTIFIER_RE.match(param_name):
+            error = self.result.add_error(
+                f"Invalid parameter name '{param_name}' in injection at {path}",
+                ErrorCodes.SEMANTIC_INVALID_PARAMETER,
+            )
+            error.add_fix("Use valid identifier like ${valid_param_name}")
 
     def _validate_simulate_block(self, simulate: Any) -> None:
         """Validate simulate block."""
@@ -2073,7 +2050,7 @@ def _validate_guided_discovery_output(self, output: Any) -> None:
             return
 
         # Validate identifier format
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", output):
+        if not _IDENTIFIER_RE.match(output):
             error = self.result.add_error(
                 f"Invalid output identifier '{output}'",
                 ErrorCodes.SEMANTIC_INVALID_PARAMETER,
@@ -440,14 +440,14 @@ def _should_generate_protein(
     ) -> bool:
         """Determine if protein generation is appropriate."""
         # Generate protein if it's a protein-related experiment
+        feature_text = str(features).lower()
         protein_related = any(
-            keyword in str(features).lower()
-            for keyword in ["protein", "peptide", "amino", "sequence"]
+            keyword in feature_text for keyword in ["protein", "peptide", "amino", "sequence"]
         )
 
+        prediction_text = classification.prediction.lower()
         classification_suggests_protein = any(
-            keyword in classification.prediction.lower()
-            for keyword in ["edit", "expression", "functional"]
+            keyword in prediction_text for keyword in ["edit", "expression", "functional"]
         )
 
         return protein_related or classification_suggests_protein
@@ -28,18 +28,24 @@ def optimize(self, params: dict[str, Any]) -> dict[str, Any]:
         objective = params.get("objective", {})
 
         results = []
-        best_score = float("-inf") if "maximize" in objective else float("inf")
+        maximize = "maximize" in objective
+        minimize = "minimize" in objective
+        best_score = float("-inf") if maximize else float("inf")
         best_params = None
 
+        # The search space is fixed for the whole run, so resolve each parameter's
+        # sampler once instead of re-inspecting its definition every iteration
+        samplers = []
+        for param_name, param_range in search_space.items():
+            if isinstance(param_range, dict) and "range" in param_range:
+                min_val, max_val = param_range["range"]
+                samplers.append((param_name, random.uniform, (min_val, max_val)))
+            else:
+                samplers.append((param_name, random.choice, (param_range,)))
+
         for i in range(max_iterations):
             # Sample random parameters from search space
-            trial_params = {}
-            for param_name, param_range in search_space.items():
-                if isinstance(param_range, dict) and "range" in param_range:
-                    min_val, max_val = param_range["range"]
-                    trial_params[param_name] = random.uniform(min_val, max_val)
-                else:
-                    trial_params[param_name] = random.choice(param_range)
+            trial_params = {name: sample(*args) for name, sample, args in samplers}
 
             # Simulate objective function evaluation
             score = random.uniform(0, 1)  # Placeholder score
@@ -47,12 +53,7 @@ def optimize(self, params: dict[str, Any]) -> dict[str, Any]:
             results.append({"iteration": i + 1, "parameters": trial_params, "score": score})
 
             # Update best result
-            if (
-                "maximize" in objective
-                and score > best_score
-                or "minimize" in objective
-                and score < best_score
-            ):
+            if maximize and score > best_score or minimize and score < best_score:
                 best_score = score
                 best_params = trial_params
 
@@ -25,6 +25,9 @@
 
 logger = logging.getLogger(__name__)
 
+# Plugin lookups keyed by kind, tagged with the registry version they were built from
+_available_plugins_cache: dict[str, tuple[int, dict[str, Any]]] = {}
+
 
 # Enums for plugin capabilities
 class EntityType(Enum):
@@ -269,6 +272,24 @@ def suggest_next(self, experiment_history: list[ExperimentResult]) -> Optimizati
             RuntimeError: If suggestion generation fails
         """
 
+    def suggest_batch(
+        self, experiment_history: list[ExperimentResult], count: int
+    ) -> list[OptimizationStep]:
+        """Suggest several parameter configurations to evaluate together.
+
+        The default implementation calls suggest_next() repeatedly. Plugins that
+        can share work across candidates (model fitting, history preprocessing)
+        should override this to do that work once per batch.
+
+        Args:
+            experiment_history: Complete history of experiments and their results
+            count: Number of configurations to suggest
+
+        Returns:
+            List of OptimizationStep objects, one per suggested configuration
+        """
+        return [self.suggest_next(experiment_history) for _ in range(count)]
+
     def should_stop(
         self, experiment_history: list[ExperimentResult], budget: dict[str, Any]
     ) -> bool:
@@ -532,12 +553,7 @@ def get_available_generators() -> dict[str, GeneratorPlugin]:
         Dictionary mapping plugin names to GeneratorPlugin instances
     """
 
-    generators = {}
-    for info in plugin_registry.list_plugins():
-        if info.instance and isinstance(info.instance, GeneratorPlugin):
-            generators[info.name] = info.instance
-
-    return generators
+    return dict(_get_available_plugins("generators", GeneratorPlugin))
 
 
 def get_available_optimizers() -> dict[str, OptimizerPlugin]:
@@ -547,9 +563,42 @@ def get_available_optimizers() -> dict[str, OptimizerPlugin]:
         Dictionary mapping plugin names to OptimizerPlugin instances
     """
 
-    optimizers = {}
+    return dict(_get_available_plugins("optimizers", OptimizerPlugin))
+
+
+def find_optimizer_for_strategy(strategy_name: str) -> OptimizerPlugin | None:
+    """Find a registered optimizer plugin supporting a strategy.
+
+    Args:
+        strategy_name: Strategy value, e.g. ``"RandomSearch"``
+
+    Returns:
+        The first optimizer plugin listing the strategy, or None
+    """
+
+    cached = _available_plugins_cache.get("strategies")
+    if cached is None or cached[0] != plugin_registry.version:
+        index: dict[str, OptimizerPlugin] = {}
+        for plugin in _get_available_plugins("optimizers", OptimizerPlugin).values():
+            for strategy in plugin.supported_strategies:
+                index.setdefault(strategy.value, plugin)
+        cached = (plugin_registry.version, index)
+        _available_plugins_cache["strategies"] = cached
+
+    return cached[1].get(strategy_name)
+
+
+def _get_available_plugins(kind: str, plugin_type: type) -> dict[str, Any]:
+    """Return registered plugin instances of a type, rescanning only when the registry changed."""
+    cached = _available_plugins_cache.get(kind)
+    if cached is not None and cached[0] == plugin_registry.version:
+        return cached[1]
+
+    plugins = {}
     for info in plugin_registry.list_plugins():
-        if info.instance and isinstance(info.instance, OptimizerPlugin):
-            optimizers[info.name] = info.instance
+        if info.instance and isinstance(info.instance, plugin_type):
+            plugins[info.name] = info.instance
 
-    return optimizers
+    # list_plugins() may itself discover plugins, so read the version afterwards
+    _available_plugins_cache[kind] = (plugin_registry.version, plugins)
+    return plugins
@@ -15,23 +15,11 @@
 from src.geneforgelang.plugins.base import BaseGeneratorPlugin, BaseOptimizerPlugin
 
 try:
-    from importlib.metadata import entry_points as _entry_points
     from importlib.metadata import version
-
-    HAS_ENTRY_POINTS = True
 except ImportError:
     try:
-        from importlib_metadata import (
-            entry_points as _entry_points,
-        )  # Python < 3.8
-        from importlib_metadata import (
-            version,
-        )
-
-        HAS_ENTRY_POINTS = True
+        from importlib_metadata import version  # Python < 3.8
     except ImportError:
-        HAS_ENTRY_POINTS = False
-        _entry_points = None
 
         def version(x):
             return "unknown"
@@ -356,7 +344,9 @@ def check_dependencies(self) -> list[str]:
 
     def load(self, registry_hooks: list[PluginLifecycleHook] | None = None) -> Any:
         """Load the plugin instance with dependency checking and lifecycle hooks."""
-        if self.state == PluginState.LOADED and self.instance is not None:
+        # An active plugin is already loaded; hand back its instance without re-running
+        # dependency checks and hooks, which would also drop it back to LOADED
+        if self.instance is not None and self.state in (PluginState.LOADED, PluginState.ACTIVE):
             return self.instance
 
         # Check dependencies first
@@ -513,6 +503,14 @@ def __init__(self):
         self._plugin_order: list[str] = []  # For dependency-based ordering
         self._generators: dict[str, type[Any]] = {}  # For BaseGeneratorPlugin registry
         self._optimizers: dict[str, type[Any]] = {}  # For BaseOptimizerPlugin registry
+        self._container_images: dict[str, str] = {}
+        self._version = 0  # Bumped whenever registered plugins, instances or states change
+        self._active_cache: tuple[int, list[PluginInfo]] | None = None
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter used to invalidate cached plugin lookups."""
+        return self._version
 
     def add_lifecycle_hook(self, hook: PluginLifecycleHook) -> None:
         """Add a lifecycle hook for plugin state changes."""
@@ -636,6 +634,7 @@ def visit(plugin_name: str) -> None:
             visit(name)
 
         self._plugin_order = ordered
+        self._version += 1
 
     def get(self, name: str) -> Any:
         """Get a plugin instance, loading if necessary."""
@@ -646,6 +645,8 @@ def get(self, name: str) -> Any:
             raise ValueError(f"Plugin '{name}' is not registered")
 
         plugin_info = self._plugins[name]
+        if plugin_info.instance is None:
+            self._version += 1
         return plugin_info.load(self._hooks)
 
     def get_info(self, name: str) -> PluginInfo:
@@ -662,29 +663,47 @@ def activate_plugin(self, name: str) -> None:
         """Load and activate a plugin."""
         plugin_info = self.get_info(name)
         if plugin_info.state != PluginState.LOADED:
+            if plugin_info.instance is None:
+                self._version += 1
             plugin_info.load(self._hooks)
-        plugin_info.activate(self._hooks)
+        try:
+            plugin_info.activate(self._hooks)
+        finally:
+            self._version += 1
 
     def deactivate_plugin(self, name: str) -> None:
         """Deactivate a plugin."""
         plugin_info = self.get_info(name)
-        plugin_info.deactivate(self._hooks)
+        try:
+            plugin_info.deactivate(self._hooks)
+        finally:
+            self._version += 1
 
     def unload_plugin(self, name: str) -> None:
         """Unload a plugin."""
         plugin_info = self.get_info(name)
         plugin_info.unload(self._hooks)
+        self._version += 1
 
     def get_active_plugins(self) -> list[PluginInfo]:
         """Get list of active plugins in execution order."""
+        return list(self._resolve_active_plugins())
+
+    def _resolve_active_plugins(self) -> list[PluginInfo]:
+        """Return the active plugins, rescanning the registry only when it changed."""
         if not self._discovered:
             self._discover_plugins()
 
+        cached = self._active_cache
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
         active = [
             self._plugins[name]
             for name in self._plugin_order
             if name in self._plugins and self._plugins[name].state == PluginState.ACTIVE
         ]
+        self._active_cache = (self._version, active)
         return active
 
     def get_plugins_by_state(self, state: PluginState) -> list[PluginInfo]:
@@ -727,7 +746,7 @@ def process_with_plugins(
         """Process data through active plugins in dependency order."""
         if plugin_names is None:
             # Use all active plugins
-            active_plugins = self.get_active_plugins()
+            active_plugins = self._resolve_active_plugins()
         else:
             # Use specified plugins, but respect dependency order
             active_plugins = []
@@ -742,123 +761,13 @@ def process_with_plugins(
             try:
                 if plugin_info.instance:
                     result = plugin_info.instance.process(result)
-                    logger.debug(f"Processed data with plugin: {plugin_info.name}")
+                    logger.debug("Processed data with plugin: %s", plugin_info.name)
             except Exception as e:
                 logger.error(f"Plugin {plugin_info.name} processing failed: {e}")
                 # Continue with other plugins rather than failing entirely
 
         return result
 
-    def _discover_plugins(self) -> None:
-        """Discover plugins via entry points with enhanced dependency tracking."""
-        if self._discovered:
-            return
-
-        logger.debug("Discovering plugins via entry points...")
-
-        if not HAS_ENTRY_POINTS:
-            logger.warning("Entry points not available, skipping plugin discovery")
-            self._discovered = True
-            return
-
-        try:
-            # Discover plugins from entry points
-            if hasattr(_entry_points, "select"):  # Python 3.10+
-                gfl_plugins = _entry_points.select(group="gfl.plugins")
-            else:  # Python 3.8-3.9
-                all_entry_points = _entry_points()
-                # Handle both dict-like and list-like entry points APIs
-                if hasattr(all_entry_points, "get"):
-                    gfl_plugins = all_entry_points.get("gfl.plugins", [])
-                else:
-                    # For newer versions where entry_points() returns a different type
-                    gfl_plugins = []
-                    try:
-                        for group in all_entry_points:
-                            if group.group == "gfl.plugins":
-                                gfl_plugins.append(group)
-                    except AttributeError:
-                        # Fallback: no entry points found
-                        gfl_plugins = []
-
-            for ep in gfl_plugins:
-                try:
-                    plugin_class = ep.load()
-
-                    # Try to get version from plugin or package
-                    plugin_version = "unknown"
-                    if hasattr(plugin_class, "version"):
-                        plugin_version = plugin_class.version
-                    elif hasattr(plugin_class, "__version__"):
-                        plugin_version = plugin_class.__version__
-                    else:
-                        # Try to get version from package
-                        try:
-                            # Extract package name from entry point
-                            pkg_name = ep.value.split(":")[0].split(".")[0]
-                            plugin_version = version(pkg_name)
-                        except Exception:
-                            pass
-
-                    self.register_class(ep.name, plugin_class, plugin_version)
-                    logger.debug(f"Discovered plugin via entry point: {ep.name}")
-
-                except Exception as e:
-                    logger.warning(f"Failed to load plugin {ep.name}: {e}")
-
-        except Exception as e:
-            logger.error(f"Plugin discovery failed: {e}")
-
-        # Auto-register built-in plugins
-        self._try_autoregister_builtin()
-
-        # Update plugin order after all discoveries
-        self._update_plugin_order()
-
-        # Log discovery summary
-        self._log_discovery_summary()
-
-        self._discovered = True
-
-    def _log_discovery_summary(self) -> None:
-        """Log summary of plugin discovery results."""
-        total_plugins = len(self._plugins)
-
-        logger.info(f"Plugin discovery complete: {total_plugins} plugins found")
-
-        # Skip dependency validation here to avoid recursion
-        # Dependencies will be validated when plugins are actually used
-
-    def _try_autoregister_builtin(self) -> None:
-        """Auto-register built-in demo plugins with dependency checking."""
-        # Attempt to import demo plugins if they are available.
-        builtin_plugins = [
-            ("alpha_genome", "gfl.plugins.alpha_genome", "AlphaGenomePlugin"),
-            ("variant_sim", "gfl.plugins.variant_sim", "VariantSimulationPlugin"),
-        ]
-
-        for name, module_name, class_name in builtin_plugins:
-            if name in self._plugins:
-                continue  # Already registered via entry point
-
-            try:
-                module = __import__(module_name, fromlist=[class_name])
-                plugin_class = getattr(module, class_name)
-
-                # Get version from module if available
-                plugin_version = "built-in"
-                if hasattr(module, "__version__"):
-                    plugin_version = module.__version__
-                elif hasattr(plugin_class, "version"):
-                    plugin_version = plugin_class.version
-
-                # Register as class for lazy loading
-                self.register_class(name, plugin_class, plugin_version)
-                logger.debug(f"Auto-registered built-in plugin: {name}")
-
-            except Exception as e:
-                logger.debug(f"Could not auto-register {name}: {e}")
-
     def reload_plugins(self) -> None:
         """Force reload of all plugins with proper cleanup."""
         logger.info("Reloading all plugins...")
@@ -874,12 +783,18 @@ def reload_plugins(self) -> None:
         self._discovered = False
         self._plugins.clear()
         self._plugin_order.clear()
+        self._version += 1
 
         # Rediscover
         self._discover_plugins()
 
     def _discover_plugins(self):
         """Discover and register external plugins via entry points."""
+        # Scanning installed distributions is expensive, so only do it once
+        if self._discovered:
+            return
+        self._discovered = True
+
         # Discover regular plugins
         entry_points = importlib.metadata.entry_points()
         for entry_point in entry_points.select(group="gfl.plugins"):
@@ -912,11 +827,13 @@ def register_generator(self, name: str, plugin_class: type[BaseGeneratorPlugin])
         """Register a generator plugin."""
         self._generators[name] = plugin_class
         self._plugins[name] = plugin_class
+        self._version += 1
 
     def register_optimizer(self, name: str, plugin_class: type[BaseOptimizerPlugin]):
         """Register an optimizer plugin."""
         self._optimizers[name] = plugin_class
         self._plugins[name] = plugin_class
+        self._version += 1
 
     def get_generator(self, name: str) -> BaseGeneratorPlugin:
         """Get a generator plugin instance."""
@@ -11,6 +11,7 @@
 """
 
 import logging
+import math
 import random
 from typing import Any, Optional
 
@@ -452,37 +453,56 @@ def setup(
 
     def suggest_next(self, experiment_history: list[ExperimentResult]) -> OptimizationStep:
         """Suggest next experiment using Bayesian optimization."""
+        return self.suggest_batch(experiment_history, 1)[0]
 
-        self._iteration_count += 1
+    def suggest_batch(
+        self, experiment_history: list[ExperimentResult], count: int
+    ) -> list[OptimizationStep]:
+        """Suggest several experiments, updating the GP model once for the whole batch."""
 
-        if len(experiment_history) < 2:
-            # Use random sampling for initial experiments
-            parameters = self._sample_random_parameters()
-            expected_improvement = None
-        else:
-            # Use Bayesian optimization with acquisition function
+        # Use Bayesian optimization once there is enough data for the model
+        use_model = len(experiment_history) >= 2
+        if use_model:
             self._update_gp_model(experiment_history)
-            parameters = self._optimize_acquisition_function(experiment_history)
-            expected_improvement = self._calculate_expected_improvement(
-                parameters, experiment_history
+            # The incumbent is fixed for the batch; find it once rather than per candidate
+            current_best = max(r.objective_value for r in experiment_history)
+
+        steps = []
+        for _ in range(count):
+            self._iteration_count += 1
+
+            if use_model:
+                parameters = self._optimize_acquisition_function(
+                    experiment_history, current_best
+                )
+                expected_improvement = self._calculate_expected_improvement(
+                    parameters, experiment_history, current_best
+                )
+            else:
+                # Use random sampling for initial experiments
+                parameters = self._sample_random_parameters()
+                expected_improvement = None
+
+            # Calculate uncertainty estimate
+            uncertainty = self._estimate_parameter_uncertainty(parameters, experiment_history)
+
+            steps.append(
+                OptimizationStep(
+                    parameters=parameters,
+                    iteration=self._iteration_count,
+                    expected_improvement=expected_improvement,
+                    uncertainty=uncertainty,
+                    metadata={
+                        "acquisition_function": self._strategy_config.get(
+                            "acquisition", "expected_improvement"
+                        ),
+                        "gp_lengthscale": 0.5 + random.uniform(-0.1, 0.1),  # Simulated
+                        "exploration_weight": self._strategy_config.get("exploration_weight", 0.1),
+                    },
+                )
             )
 
-        # Calculate uncertainty estimate
-        uncertainty = self._estimate_parameter_uncertainty(parameters, experiment_history)
-
-        return OptimizationStep(
-            parameters=parameters,
-            iteration=self._iteration_count,
-            expected_improvement=expected_improvement,
-            uncertainty=uncertainty,
-            metadata={
-                "acquisition_function": self._strategy_config.get(
-                    "acquisition", "expected_improvement"
-                ),
-                "gp_lengthscale": 0.5 + random.uniform(-0.1, 0.1),  # Simulated
-                "exploration_weight": self._strategy_config.get("exploration_weight", 0.1),
-            },
-        )
+        return steps
 
     def _parse_search_space(self, search_space: dict[str, str]) -> dict[str, dict[str, Any]]:
         """Parse search space definitions into structured format."""
@@ -505,16 +525,25 @@ def _parse_search_space(self, search_space: dict[str, str]) -> dict[str, dict[st
 
     def _sample_random_parameters(self) -> dict[str, Any]:
         """Sample random parameters for initial exploration."""
-        parameters = {}
+        return self._sample_random_parameter_batch(1)[0]
+
+    def _sample_random_parameter_batch(self, count: int) -> list[dict[str, Any]]:
+        """Sample several random parameter sets, drawing each parameter's values together."""
+        columns = {}
 
         for param, config in self._search_space.items():
             if config["type"] == "continuous":
-                bounds = config["bounds"]
-                parameters[param] = random.uniform(bounds[0], bounds[1])
+                low, high = config["bounds"]
+                span = high - low
+                columns[param] = [low + span * random.random() for _ in range(count)]
             elif config["type"] == "discrete":
-                parameters[param] = random.choice(config["choices"])
+                columns[param] = random.choices(config["choices"], k=count)
 
-        return parameters
+        if not columns:
+            return [{} for _ in range(count)]
+
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
 
     def _update_gp_model(self, experiment_history: list[ExperimentResult]) -> None:
         """Update Gaussian Process model with new data (simulated)."""
@@ -522,18 +551,28 @@ def _update_gp_model(self, experiment_history: list[ExperimentResult]) -> None:
         logger.debug(f"Updating GP model with {len(experiment_history)} data points")
 
     def _optimize_acquisition_function(
-        self, experiment_history: list[ExperimentResult]
+        self, experiment_history: list[ExperimentResult], current_best: Optional[float] = None
     ) -> dict[str, Any]:
         """Optimize acquisition function to suggest next parameters."""
+        if current_best is None and experiment_history:
+            current_best = max(r.objective_value for r in experiment_history)
 
         # Simulate acquisition function optimization
         best_params = None
         best_acquisition = -float("inf")
 
+        # Lay the history out once as rows of continuous coordinates, so scoring each
+        # candidate walks flat lists instead of probing every experiment's parameter dict
+        continuous = [p for p, c in self._search_space.items() if c["type"] == "continuous"]
+        history_points = None
+        if all(p in r.parameters for r in experiment_history for p in continuous):
+            history_points = [[r.parameters[p] for p in continuous] for r in experiment_history]
+
         # Sample multiple candidates and pick best
-        for _ in range(100):
-            candidate = self._sample_random_parameters()
-            acquisition_value = self._evaluate_acquisition_function(candidate, experiment_history)
+        for candidate in self._sample_random_parameter_batch(100):
+            acquisition_value = self._evaluate_acquisition_function(
+                candidate, experiment_history, current_best, history_points
+            )
 
             if acquisition_value > best_acquisition:
                 best_acquisition = acquisition_value
@@ -542,7 +581,11 @@ def _optimize_acquisition_function(
         return best_params
 
     def _evaluate_acquisition_function(
-        self, parameters: dict[str, Any], experiment_history: list[ExperimentResult]
+        self,
+        parameters: dict[str, Any],
+        experiment_history: list[ExperimentResult],
+        current_best: Optional[float] = None,
+        history_points: Optional[list[list[float]]] = None,
     ) -> float:
         """Evaluate acquisition function for given parameters (simulated)."""
 
@@ -550,31 +593,39 @@ def _evaluate_acquisition_function(
         if not experiment_history:
             return random.uniform(0, 1)
 
-        # Simple simulation: favor parameters far from previous experiments
-        distances = []
-        for result in experiment_history:
-            distance = 0
-            for param, value in parameters.items():
-                if param in result.parameters and isinstance(value, (int, float)):
-                    distance += abs(value - result.parameters[param]) ** 2
-            distances.append(distance**0.5)
+        # Simple simulation: favor parameters far from previous experiments.
+        # Parameters missing from a past experiment contribute no distance.
+        numeric = [p for p, value in parameters.items() if isinstance(value, (int, float))]
+        point = [parameters[p] for p in numeric]
+        if history_points is not None:
+            min_distance = min(math.dist(point, row) for row in history_points)
+        else:
+            min_distance = min(
+                math.dist(point, [result.parameters.get(p, parameters[p]) for p in numeric])
+                for result in experiment_history
+            )
 
         # Expected improvement simulation
-        min_distance = min(distances) if distances else 1.0
-        exploitation = max(r.objective_value for r in experiment_history)
+        if current_best is None:
+            current_best = max(r.objective_value for r in experiment_history)
+        exploitation = current_best
         exploration = min_distance
 
         exploration_weight = self._strategy_config.get("exploration_weight", 0.1)
         return exploitation + exploration_weight * exploration + random.uniform(-0.1, 0.1)
 
     def _calculate_expected_improvement(
-        self, parameters: dict[str, Any], experiment_history: list[ExperimentResult]
+        self,
+        parameters: dict[str, Any],
+        experiment_history: list[ExperimentResult],
+        current_best: Optional[float] = None,
     ) -> float:
         """Calculate expected improvement for suggested parameters."""
         if not experiment_history:
             return 0.5  # Default for initial experiments
 
-        current_best = max(r.objective_value for r in experiment_history)
+        if current_best is None:
+            current_best = max(r.objective_value for r in experiment_history)
 
         # Simulate expected improvement calculation
         return max(0.0, random.uniform(0.1, 0.8) - (current_best * 0.1))
@@ -589,15 +640,11 @@ def _estimate_parameter_uncertainty(
             return random.uniform(0.5, 0.9)
 
         # Distance-based uncertainty simulation
-        min_distance = float("inf")
-        for result in experiment_history:
-            distance = (
-                sum(
-                    abs(parameters.get(p, 0) - result.parameters.get(p, 0)) ** 2 for p in parameters
-                )
-                ** 0.5
-            )
-            min_distance = min(min_distance, distance)
+        point = list(parameters.values())
+        min_distance = min(
+            math.dist(point, [result.parameters.get(p, 0) for p in parameters])
+            for result in experiment_history
+        )
 
         # Normalize uncertainty based on exploration
         uncertainty = min(1.0, min_distance / 10.0 + 0.1)
@@ -14,7 +14,18 @@
 
 from __future__ import annotations
 
+import contextlib
+import copy
+import hashlib
 import logging
+import os
+import queue
+import re
+import sys
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -40,15 +51,9 @@
 
 # Import performance components with fallback
 try:
-    from geneforgelang.core.performance import cached, get_monitor
+    from geneforgelang.core.performance import get_monitor
 except ImportError:
     # Provide fallback implementations
-    def cached(cache_name=None, ttl=None, max_size=None):
-        def decorator(func):
-            return func
-
-        return decorator
-
     class MockMonitor:
         def time_operation(self, name):
             class MockContext:
@@ -66,6 +71,92 @@ def get_monitor():
 
 logger = logging.getLogger(__name__)
 
+# Escape sequences understood inside string literals, resolved in a single pass
+_STRING_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "'": "'", "\\": "\\"}
+_STRING_ESCAPE_RE = re.compile(r"\\([ntr\"'\\])")
+
+# PLY lexer built for each lexer class; instances get clones bound to themselves
+_PLY_LEXERS: dict[type, lex.Lexer] = {}
+
+# Number of parse results each parser keeps for repeated inputs
+_PARSE_CACHE_SIZE = 100
+
+# Reserved words, keyed by their lowercase spelling
+_RESERVED = {
+    # Core blocks
+    "experiment": "EXPERIMENT",
+    "analyze": "ANALYZE",
+    "analyse": "ANALYZE",  # British spelling
+    "simulate": "SIMULATE",
+    "branch": "BRANCH",
+    "metadata": "METADATA",
+    # Control flow
+    "if": "IF",
+    "then": "THEN",
+    "else": "ELSE",
+    # Logical operators
+    "and": "AND",
+    "or": "OR",
+    "not": "NOT",
+    # Boolean values
+    "true": "BOOLEAN",
+    "false": "BOOLEAN",
+    "yes": "BOOLEAN",
+    "no": "BOOLEAN",
+    "on": "BOOLEAN",
+    "off": "BOOLEAN",
+    # Null values
+    "null": "NULL",
+    "none": "NULL",
+}
+
+# Longer identifiers cannot be a reserved word in any case, so they skip case folding
+_RESERVED_MAX_LEN = max(map(len, _RESERVED))
+
+# Reserved words that end up as the operator of an expression node, with the one
+# spelling (and string object) every occurrence is given in the AST
+_LOGICAL_OPERATORS = {"AND": "and", "OR": "or", "NOT": "not"}
+
+# BOOLEAN reserved words that lex to True
+_TRUE_WORDS = frozenset({"true", "yes", "on"})
+
+# Token names: literals, operators and delimiters, then the reserved-word tokens
+_TOKENS = (
+    # Literals
+    "IDENTIFIER",
+    "NUMBER",
+    "STRING",
+    "BOOLEAN",
+    "NULL",
+    # Operators
+    "PLUS",
+    "MINUS",
+    "TIMES",
+    "DIVIDE",
+    "MODULO",
+    "POWER",
+    "EQUALS",
+    "NOT_EQUALS",
+    "LESS_THAN",
+    "GREATER_THAN",
+    "LESS_EQUAL",
+    "GREATER_EQUAL",
+    "ASSIGN",
+    # Delimiters
+    "LPAREN",
+    "RPAREN",
+    "LBRACE",
+    "RBRACE",
+    "LBRACKET",
+    "RBRACKET",
+    "COMMA",
+    "COLON",
+    "SEMICOLON",
+    "DOT",
+    "ARROW",
+    "PIPE",
+) + tuple(sorted({t for t in _RESERVED.values() if t not in ("BOOLEAN", "NULL")}))
+
 
 class GFLSyntaxError(Exception):
     """Exception raised for GFL syntax errors."""
@@ -80,70 +171,10 @@ class AdvancedGFLLexer:
     """Enhanced lexer for GeneForgeLang with comprehensive token support."""
 
     # Reserved words
-    reserved = {
-        # Core blocks
-        "experiment": "EXPERIMENT",
-        "analyze": "ANALYZE",
-        "analyse": "ANALYZE",  # British spelling
-        "simulate": "SIMULATE",
-        "branch": "BRANCH",
-        "metadata": "METADATA",
-        # Control flow
-        "if": "IF",
-        "then": "THEN",
-        "else": "ELSE",
-        # Logical operators
-        "and": "AND",
-        "or": "OR",
-        "not": "NOT",
-        # Boolean values
-        "true": "BOOLEAN",
-        "false": "BOOLEAN",
-        "yes": "BOOLEAN",
-        "no": "BOOLEAN",
-        "on": "BOOLEAN",
-        "off": "BOOLEAN",
-        # Null values
-        "null": "NULL",
-        "none": "NULL",
-    }
+    reserved = _RESERVED
 
     # List of token names
-    tokens = [
-        # Literals
-        "IDENTIFIER",
-        "NUMBER",
-        "STRING",
-        "BOOLEAN",
-        "NULL",
-        # Operators
-        "PLUS",
-        "MINUS",
-        "TIMES",
-        "DIVIDE",
-        "MODULO",
-        "POWER",
-        "EQUALS",
-        "NOT_EQUALS",
-        "LESS_THAN",
-        "GREATER_THAN",
-        "LESS_EQUAL",
-        "GREATER_EQUAL",
-        "ASSIGN",
-        # Delimiters
-        "LPAREN",
-        "RPAREN",
-        "LBRACE",
-        "RBRACE",
-        "LBRACKET",
-        "RBRACKET",
-        "COMMA",
-        "COLON",
-        "SEMICOLON",
-        "DOT",
-        "ARROW",
-        "PIPE",
-    ] + [t for t in set(reserved.values()) if t not in ["BOOLEAN", "NULL"]]
+    tokens = _TOKENS
 
     # Token rules - order matters for multi-character operators
     t_ARROW = r"->"
@@ -180,13 +211,18 @@ class AdvancedGFLLexer:
     # Ignored characters (spaces and tabs)
     t_ignore = " \t"
 
+    __slots__ = ("lexer",)
+
     def __init__(self):
         self.lexer = None
         self._build()
 
     def _build(self):
-        """Build the lexer."""
-        self.lexer = lex.lex(module=self, debug=False)
+        """Build the lexer, compiling the PLY tables only once per lexer class."""
+        template = _PLY_LEXERS.get(type(self))
+        if template is None:
+            template = _PLY_LEXERS[type(self)] = lex.lex(module=self, debug=False)
+        self.lexer = template.clone(self)
 
     def t_COMMENT(self, t):
         r"\#.*"
@@ -194,16 +230,18 @@ def t_COMMENT(self, t):
 
     def t_MULTILINE_COMMENT(self, t):
         r"/\*([^*]|\*+[^*/])*\*+/"
-        # Multi-line comments are ignored
-        # t.lexer.lineno += t.value.count("\\n")
+        # Multi-line comments are ignored, but their lines still count
+        t.lexer.lineno += t.value.count("\n")
 
     def t_NUMBER(self, t):
         r"\d+(\.\d*)?([eE][+-]?\d+)?"
         try:
-            if "." in t.value or "e" in t.value.lower():
-                t.value = float(t.value)
-            else:
+            # The pattern only admits digits, '.', exponents and signs, so an
+            # all-digit match is an integer and anything else is a float
+            if t.value.isdigit():
                 t.value = int(t.value)
+            else:
+                t.value = float(t.value)
         except ValueError:
             logger.warning(f"Invalid number format: {t.value}")
             t.value = 0
@@ -214,24 +252,36 @@ def t_STRING(self, t):
         # Remove quotes and handle escape sequences
         content = t.value[1:-1]
         # Basic escape sequence handling
-        content = content.replace("\\n", "\n")
-        content = content.replace("\\t", "\t")
-        content = content.replace("\\r", "\r")
-        content = content.replace('\\"', '"')
-        content = content.replace("\\'", "'")
-        content = content.replace("\\\\", "\\")
+        if "\\" in content:
+            content = _STRING_ESCAPE_RE.sub(lambda m: _STRING_ESCAPES[m.group(1)], content)
 
         t.value = content
         return t
 
     def t_IDENTIFIER(self, t):
         r"[a-zA-Z_][a-zA-Z_0-9]*"
-        # Check for reserved words (case insensitive)
-        t.type = self.reserved.get(t.value.lower(), "IDENTIFIER")
-
-        # Handle boolean values
-        if t.type == "BOOLEAN":
-            t.value = t.value.lower() in ("true", "yes", "on")
+        # Check for reserved words (case insensitive); most sources already use lowercase,
+        # so only fold the case when the exact spelling misses and could be a reserved word
+        word = t.value
+        token_type = _RESERVED.get(word)
+        if token_type is None and len(word) <= _RESERVED_MAX_LEN and not word.islower():
+            word = word.lower()
+            token_type = _RESERVED.get(word)
+        if token_type is None:
+            # Names repeat throughout a document and become AST dict keys, so intern them
+            t.type = "IDENTIFIER"
+            t.value = sys.intern(t.value)
+            return t
+        t.type = token_type
+
+        # Share one canonical string per operator so consumers can compare exactly
+        operator = _LOGICAL_OPERATORS.get(token_type)
+        if operator is not None:
+            t.value = operator
+
+        # Handle boolean values; ``word`` is already lowercase for any reserved word
+        if token_type == "BOOLEAN":
+            t.value = word in _TRUE_WORDS
 
         return t
 
@@ -245,38 +295,134 @@ def t_error(self, t):
         t.lexer.skip(1)
 
     def tokenize(self, data: str) -> list[Any]:
-        """Tokenize input data and return list of tokens."""
-        self.lexer.input(data)
-        tokens = []
-        while True:
-            tok = self.lexer.token()
-            if not tok:
-                break
-            tokens.append(tok)
-        return tokens
+        """Tokenize input data and return list of tokens.
+
+        Prefer ``itertokens`` when the tokens are only iterated once, so large
+        inputs are not held in memory as a full token list.
+        """
+        return list(self.itertokens(data))
+
+    def itertokens(self, data: str) -> Iterator[Any]:
+        """Yield the tokens of data one at a time.
+
+        Scans with the combined token pattern directly instead of driving the PLY
+        lexer one ``token()`` call at a time. The parser pulls from this generator,
+        so tokens are produced as the grammar consumes them.
+        """
+        actions = {name: getattr(self, f"t_{name}") for name in _TOKEN_ACTIONS}
+        match = _TOKEN_RE.match
+        skip_ignored = _IGNORE_RE.match
+        ignore = self.t_ignore
+        lineno = 1
+        pos = 0
+        end = len(data)
+
+        while pos < end:
+            if data[pos] in ignore:
+                # Indentation comes in runs, so skip the whole run at once
+                pos = skip_ignored(data, pos).end()
+                continue
+
+            m = match(data, pos)
+            if m is None:
+                logger.error(f"Illegal character '{data[pos]}' at line {lineno}")
+                pos += 1
+                continue
+
+            kind = m.lastgroup
+            value = m.group()
+            start = pos
+            pos = m.end()
+
+            if kind == "NEWLINE":
+                lineno += len(value)
+                continue
+            if kind == "COMMENT":
+                continue
+            if kind == "MULTILINE_COMMENT":
+                lineno += value.count("\n")
+                continue
+
+            tok = lex.LexToken()
+            tok.type = kind
+            tok.value = value
+            tok.lineno = lineno
+            tok.lexpos = start
+
+            action = actions.get(kind)
+            if action is not None:
+                tok = action(tok)
+                if tok is None:
+                    continue
+            yield tok
+
+
+def _build_token_re() -> re.Pattern[str]:
+    """Combine the lexer's rules into one pattern, in the priority order PLY uses."""
+    rules = [
+        (name, getattr(AdvancedGFLLexer, name))
+        for name in dir(AdvancedGFLLexer)
+        if name.startswith("t_") and name not in ("t_error", "t_ignore")
+    ]
+    # Function rules match first, in definition order, then string rules longest first
+    functions = sorted(
+        (rule for _, rule in rules if callable(rule)),
+        key=lambda rule: rule.__code__.co_firstlineno,
+    )
+    strings = sorted(
+        ((name, rule) for name, rule in rules if isinstance(rule, str)),
+        key=lambda item: len(item[1]),
+        reverse=True,
+    )
+    patterns = [(rule.__name__[2:], rule.__doc__) for rule in functions]
+    patterns += [(name[2:], rule) for name, rule in strings]
+    # PLY compiles rules in verbose mode, so do the same
+    return re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in patterns), re.VERBOSE)
+
+
+_TOKEN_RE = _build_token_re()
+_IGNORE_RE = re.compile(f"[{re.escape(AdvancedGFLLexer.t_ignore)}]+")
+# Rules whose token needs post-processing by the matching t_ method
+_TOKEN_ACTIONS = ("NUMBER", "STRING", "IDENTIFIER")
 
 
 class AdvancedGFLParser:
     """Advanced parser for GeneForgeLang with comprehensive grammar support."""
 
+    __slots__ = ("lexer", "parser", "errors", "current_file", "_parse_cache")
+
+    tokens = _TOKENS
+
     def __init__(self, lexer: AdvancedGFLLexer | None = None):
         self.lexer = lexer or AdvancedGFLLexer()
-        self.tokens = self.lexer.tokens
         self.parser = None
         self.errors: list[EnhancedValidationError] = []
+        self.current_file = "<input>"
+        # Recent results keyed by (digest of source, filename), oldest first
+        self._parse_cache: OrderedDict[tuple[bytes, str], EnhancedValidationResult] = (
+            OrderedDict()
+        )
         self._build()
 
     def _build(self):
         """Build the parser."""
-        # Create parser output directory
+        # Create parser output directory. On read-only installs with no table matching the
+        # grammar, every parser build regenerating the tables in memory is the intended fallback
         parser_dir = Path(__file__).parent / "parser_cache"
-        parser_dir.mkdir(exist_ok=True)
+        try:
+            parser_dir.mkdir(exist_ok=True)
+            write_tables = os.access(parser_dir, os.W_OK)
+        except OSError:
+            write_tables = False
 
+        # Name the table module after the directory it is written to, so later builds
+        # import the generated tables instead of regenerating the LALR automaton
         self.parser = yacc.yacc(
             module=self,
             debug=False,
+            write_tables=write_tables,
             outputdir=str(parser_dir),
-            debugfile="gfl_parser.out",
+            tabmodule=f"{__package__}.parser_cache.parsetab",
         )
 
     # Precedence and associativity rules
@@ -306,7 +452,9 @@ def p_statement_list(self, p):
         | statement
         | empty"""
         if len(p) == 3:
-            p[0] = (p[1] or []) + [p[2]]
+            # Extend the list in place; rebuilding it per statement is quadratic
+            p[0] = p[1] if p[1] is not None else []
+            p[0].append(p[2])
         elif len(p) == 2 and p[1]:
             p[0] = [p[1]]
         else:
@@ -403,7 +551,7 @@ def p_property_list(self, p):
         | property
         | empty"""
         if len(p) == 4:
-            p[0] = p[1] or {}
+            p[0] = p[1] if p[1] is not None else {}
             p[0].update(p[3] or {})
         elif len(p) == 2 and p[1]:
             p[0] = p[1]
@@ -441,7 +589,8 @@ def p_expression_list(self, p):
         | expression
         | empty"""
         if len(p) == 4:
-            p[0] = (p[1] or []) + [p[3]]
+            p[0] = p[1] if p[1] is not None else []
+            p[0].append(p[3])
         elif len(p) == 2 and p[1] is not None:
             p[0] = [p[1]]
         else:
@@ -455,16 +604,7 @@ def p_logical_expression(self, p):
         """logical_expression : logical_expression AND comparison_expression
         | logical_expression OR comparison_expression
         | comparison_expression"""
-        if len(p) == 4:
-            p[0] = {
-                "type": "binary_op",
-                "operator": p[2],
-                "left": p[1],
-                "right": p[3],
-                "location": self._get_location(p, 2),
-            }
-        else:
-            p[0] = p[1]
+        p[0] = self._binary_op(p) if len(p) == 4 else p[1]
 
     def p_comparison_expression(self, p):
         """comparison_expression : arithmetic_expression EQUALS arithmetic_expression
@@ -474,47 +614,20 @@ def p_comparison_expression(self, p):
         | arithmetic_expression LESS_EQUAL arithmetic_expression
         | arithmetic_expression GREATER_EQUAL arithmetic_expression
         | arithmetic_expression"""
-        if len(p) == 4:
-            p[0] = {
-                "type": "binary_op",
-                "operator": p[2],
-                "left": p[1],
-                "right": p[3],
-                "location": self._get_location(p, 2),
-            }
-        else:
-            p[0] = p[1]
+        p[0] = self._binary_op(p) if len(p) == 4 else p[1]
 
     def p_arithmetic_expression(self, p):
         """arithmetic_expression : arithmetic_expression PLUS term
         | arithmetic_expression MINUS term
         | term"""
-        if len(p) == 4:
-            p[0] = {
-                "type": "binary_op",
-                "operator": p[2],
-                "left": p[1],
-                "right": p[3],
-                "location": self._get_location(p, 2),
-            }
-        else:
-            p[0] = p[1]
+        p[0] = self._binary_op(p) if len(p) == 4 else p[1]
 
     def p_term(self, p):
         """term : term TIMES factor
         | term DIVIDE factor
         | term MODULO factor
         | factor"""
-        if len(p) == 4:
-            p[0] = {
-                "type": "binary_op",
-                "operator": p[2],
-                "left": p[1],
-                "right": p[3],
-                "location": self._get_location(p, 2),
-            }
-        else:
-            p[0] = p[1]
+        p[0] = self._binary_op(p) if len(p) == 4 else p[1]
 
     def p_factor(self, p):
         """factor : MINUS factor %prec UMINUS
@@ -534,16 +647,7 @@ def p_factor(self, p):
     def p_power(self, p):
         """power : atom POWER factor
         | atom"""
-        if len(p) == 4:
-            p[0] = {
-                "type": "binary_op",
-                "operator": p[2],
-                "left": p[1],
-                "right": p[3],
-                "location": self._get_location(p, 2),
-            }
-        else:
-            p[0] = p[1]
+        p[0] = self._binary_op(p) if len(p) == 4 else p[1]
 
     def p_atom(self, p):
         """atom : LPAREN expression RPAREN
@@ -581,6 +685,16 @@ def p_boolean_value(self, p):
     def p_empty(self, p):
         """empty :"""
 
+    def _binary_op(self, p) -> dict[str, Any]:
+        """Build the node for a ``left OPERATOR right`` production."""
+        return {
+            "type": "binary_op",
+            "operator": p[2],
+            "left": p[1],
+            "right": p[3],
+            "location": self._get_location(p, 2),
+        }
+
     def p_error(self, p):
         """Handle syntax errors."""
         if p:
@@ -618,27 +732,51 @@ def p_error(self, p):
         logger.error(f"Syntax error: {error.message}")
 
     def _get_location(self, p, index: int) -> SourceLocation:
-        """Get source location for a parser token."""
-        if hasattr(p, "lineno") and hasattr(p, "lexpos"):
-            return SourceLocation(
-                line=(
-                    p.lineno(index) if callable(p.lineno) else getattr(p.slice[index], "lineno", 1)
-                ),
-                column=getattr(p.slice[index], "lexpos", 0),
-                file_path=getattr(self, "current_file", "<input>"),
-            )
-        return SourceLocation(line=1, column=0, file_path="<input>")
+        """Get source location for a parser symbol."""
+        return SourceLocation(
+            line=p.lineno(index), column=p.lexpos(index), file_path=self.current_file
+        )
 
-    @cached(cache_name="grammar_parse", ttl=300.0, max_size=100)
-    def parse(self, data: str, filename: str = "<input>") -> EnhancedValidationResult:
-        """Parse GFL code and return enhanced validation result."""
+    def parse(
+        self, data: str, filename: str = "<input>", memoize: bool = False
+    ) -> EnhancedValidationResult:
+        """Parse GFL code and return enhanced validation result.
+
+        With ``memoize=True`` results are kept in a small per-parser LRU keyed on
+        the source digest. This only pays off when the same source is parsed
+        repeatedly; GFL's grammar parses in one pass, so for one-off documents
+        hashing and storing the result is pure overhead. Every call returns its
+        own copy, so callers may modify the result freely.
+        """
+        if not memoize:
+            return self._parse(data, filename)
+
+        # A short digest keeps cache keys small and cheap to compare on hits
+        key = (hashlib.blake2b(data.encode("utf-8"), digest_size=16).digest(), filename)
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            # Results are mutable, so never hand out the cached object itself
+            return copy.deepcopy(cached)
+
+        result = self._parse(data, filename)
+        self._parse_cache[key] = copy.deepcopy(result)
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return result
+
+    def _parse(self, data: str, filename: str) -> EnhancedValidationResult:
+        """Run the PLY parser over data and wrap the outcome."""
         with get_monitor().time_operation("grammar_parse"):
             self.errors.clear()
             self.current_file = filename
 
             try:
-                # Parse the input
-                ast = self.parser.parse(data, lexer=self.lexer.lexer, debug=False)
+                # Parse the input, feeding yacc from the combined-pattern scanner
+                tokens = self.lexer.itertokens(data)
+                ast = self.parser.parse(
+                    lexer=self.lexer.lexer, tokenfunc=partial(next, tokens, None), debug=False
+                )
 
                 # Create result
                 result = EnhancedValidationResult(file_path=filename)
@@ -675,8 +813,108 @@ def create_parser(lexer: AdvancedGFLLexer | None = None) -> AdvancedGFLParser:
     return AdvancedGFLParser(lexer)
 
 
-# Convenience function
-def parse_gfl_grammar(code: str, filename: str = "<input>") -> EnhancedValidationResult:
+# Idle parsers for parse_gfl_grammar. A parser keeps per-parse state, so each call checks
+# one out; LIFO order keeps a single-threaded caller on the same warm parser and its cache.
+_PARSER_POOL: queue.LifoQueue[AdvancedGFLParser] = queue.LifoQueue(
+    maxsize=2 * (os.cpu_count() or 1)
+)
+
+
+def _acquire_parser() -> AdvancedGFLParser:
+    """Check an idle parser out of the pool, building one if none is free."""
+    try:
+        return _PARSER_POOL.get_nowait()
+    except queue.Empty:
+        return create_parser()
+
+
+def _release_parser(parser: AdvancedGFLParser) -> None:
+    """Return a parser to the pool, dropping it if the pool is full."""
+    with contextlib.suppress(queue.Full):
+        _PARSER_POOL.put_nowait(parser)
+
+
+# Convenience functions
+def parse_gfl_grammar(
+    code: str, filename: str = "<input>", memoize: bool = False
+) -> EnhancedValidationResult:
     """Parse GFL code using the grammar-based parser."""
-    parser = create_parser()
-    return parser.parse(code, filename)
+    parser = _acquire_parser()
+    try:
+        return parser.parse(code, filename, memoize=memoize)
+    finally:
+        _release_parser(parser)
+
+
+def parse_gfl_grammar_batch(
+    codes: list[str], filenames: list[str] | None = None
+) -> list[EnhancedValidationResult]:
+    """Parse several GFL documents with a single pooled parser.
+
+    Args:
+        codes: GFL sources to parse, in order
+        filenames: Optional filename for each source, used in error locations
+
+    Returns:
+        One result per source, in the same order
+    """
+    if filenames is None:
+        filenames = ["<input>"] * len(codes)
+
+    parser = _acquire_parser()
+    try:
+        return [parser.parse(code, filename) for code, filename in zip(codes, filenames)]
+    finally:
+        _release_parser(parser)
+
+
+# Parser owned by a parse_gfl_grammar_parallel worker process, built once by its initializer
+_WORKER_PARSER: AdvancedGFLParser | None = None
+
+
+def _init_parse_worker() -> None:
+    """Build the parser a worker process reuses for every chunk it receives."""
+    global _WORKER_PARSER
+    _WORKER_PARSER = create_parser()
+
+
+def _parse_chunk(chunk: list[tuple[str, str]]) -> list[EnhancedValidationResult]:
+    """Parse one chunk of (code, filename) pairs with the worker's parser."""
+    global _WORKER_PARSER
+    if _WORKER_PARSER is None:
+        # The pool initializer did not run in this process, so build the parser here
+        _WORKER_PARSER = create_parser()
+    return [_WORKER_PARSER.parse(code, filename) for code, filename in chunk]
+
+
+def parse_gfl_grammar_parallel(
+    codes: list[str],
+    filenames: list[str] | None = None,
+    max_workers: int | None = None,
+    chunk_size: int = 64,
+) -> list[EnhancedValidationResult]:
+    """Parse many GFL documents across worker processes.
+
+    Documents are sent to workers in chunks of ``chunk_size`` so the cost of
+    pickling results is amortised. Inputs that fit in a single chunk are parsed
+    in-process, since starting a pool would cost more than it saves.
+
+    Args:
+        codes: GFL sources to parse, in order
+        filenames: Optional filename for each source, used in error locations
+        max_workers: Number of worker processes (defaults to the CPU count)
+        chunk_size: Number of documents handed to a worker at a time
+
+    Returns:
+        One result per source, in the same order
+    """
+    if filenames is None:
+        filenames = ["<input>"] * len(codes)
+
+    pairs = list(zip(codes, filenames))
+    chunks = [pairs[i : i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+    if len(chunks) <= 1 or max_workers == 1:
+        return parse_gfl_grammar_batch(codes, filenames)
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_parse_worker) as executor:
+        return [result for results in executor.map(_parse_chunk, chunks) for result in results]
@@ -0,0 +1,8 @@
+"""Generated PLY parse tables for the GFL grammar.
+
+``parsetab.py`` is written by PLY and loaded by ``AdvancedGFLParser`` so that building a
+parser does not regenerate the LALR automaton. PLY rewrites it whenever the grammar changes
+and the package is writable; to regenerate it explicitly, delete it and run from the repo root::
+
+    PYTHONPATH=src python -c "import geneforgelang.utils.grammar_parser as g; g.create_parser()"
+"""
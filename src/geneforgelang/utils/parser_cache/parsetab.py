@@ -0,0 +1,104 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftORleftANDleftNOTleftEQUALSNOT_EQUALSleftLESS_THANGREATER_THANLESS_EQUALGREATER_EQUALleftPLUSMINUSleftTIMESDIVIDEMODULOrightUMINUSUPLUSleftPOWERANALYZE AND ARROW ASSIGN BOOLEAN BRANCH COLON COMMA DIVIDE DOT ELSE EQUALS EXPERIMENT GREATER_EQUAL GREATER_THAN IDENTIFIER IF LBRACE LBRACKET LESS_EQUAL LESS_THAN LPAREN METADATA MINUS MODULO NOT NOT_EQUALS NULL NUMBER OR PIPE PLUS POWER RBRACE RBRACKET RPAREN SEMICOLON SIMULATE STRING THEN TIMESprogram : statement_liststatement_list : statement_list statement\n        | statement\n        | emptystatement : experiment_statement\n        | analyze_statement\n        | simulate_statement\n        | branch_statement\n        | metadata_statement\n        | assignment_statementexperiment_statement : EXPERIMENT COLON experiment_bodyexperiment_body : LBRACE property_list RBRACE\n        | property_listanalyze_statement : ANALYZE COLON analyze_bodyanalyze_body : LBRACE property_list RBRACE\n        | property_listsimulate_statement : SIMULATE COLON boolean_value\n        | SIMULATE COLON simulate_bodysimulate_body : LBRACE property_list RBRACE\n        | property_listbranch_statement : BRANCH COLON LBRACE branch_body RBRACEbranch_body : IF COLON expression COMMA statement_list\n        | IF COLON expression COMMA statement_list ELSE COLON statement_listmetadata_statement : METADATA COLON metadata_bodymetadata_body : LBRACE property_list RBRACE\n        | property_listassignment_statement : IDENTIFIER COLON valueproperty_list : property_list COMMA property\n        | property\n        | emptyproperty : IDENTIFIER COLON valuevalue : expression\n        | object_literal\n        | array_literalobject_literal : LBRACE property_list RBRACE\n        | LBRACE RBRACEarray_literal : LBRACKET expression_list RBRACKET\n        | LBRACKET RBRACKETexpression_list : expression_list COMMA expression\n        | expression\n        | emptyexpression : logical_expressionlogical_expression : logical_expression AND comparison_expression\n        | logical_expression OR comparison_expression\n        | comparison_expressioncomparison_expression : arithmetic_expression EQUALS arithmetic_expression\n        | arithmetic_expression NOT_EQUALS arithmetic_expression\n        | arithmetic_expression LESS_THAN arithmetic_expression\n        | arithmetic_expression GREATER_THAN arithmetic_expression\n        | arithmetic_expression LESS_EQUAL arithmetic_expression\n        | arithmetic_expression GREATER_EQUAL arithmetic_expression\n        | arithmetic_expressionarithmetic_expression : arithmetic_expression PLUS term\n        | arithmetic_expression MINUS term\n        | termterm : term TIMES factor\n        | term DIVIDE factor\n        | term MODULO factor\n        | factorfactor : MINUS factor %prec UMINUS\n        | PLUS factor %prec UPLUS\n        | NOT factor\n        | powerpower : atom POWER factor\n        | atomatom : LPAREN expression RPAREN\n        | literal\n        | IDENTIFIERliteral : NUMBER\n        | STRING\n        | boolean_value\n        | NULLboolean_value : BOOLEANempty :'
+    
+_lr_action_items = {'EXPERIMENT':([0,2,3,4,5,6,7,8,9,10,17,18,19,20,22,24,26,27,28,30,32,33,34,35,37,39,41,42,43,44,45,46,47,50,51,53,55,57,58,60,61,62,63,64,76,78,89,93,94,97,98,99,100,101,102,104,105,106,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,],[11,11,-3,-4,-5,-6,-7,-8,-9,-10,-2,-74,-74,-74,-74,-11,-13,-29,-30,-14,-16,-17,-18,-73,-20,-24,-26,-68,-27,-32,-33,-34,-42,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,-36,-38,-61,-60,-62,-12,-28,-31,-15,-19,-21,-25,-43,-44,-35,-37,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,11,11,11,11,]),'ANALYZE':([0,2,3,4,5,6,7,8,9,10,17,18,19,20,22,24,26,27,28,30,32,33,34,35,37,39,41,42,43,44,45,46,47,50,51,53,55,57,58,60,61,62,63,64,76,78,89,93,94,97,98,99,100,101,102,104,105,106,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,],[12,12,-3,-4,-5,-6,-7,-8,-9,-10,-2,-74,-74,-74,-74,-11,-13,-29,-30,-14,-16,-17,-18,-73,-20,-24,-26,-68,-27,-32,-33,-34,-42,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,-36,-38,-61,-60,-62,-12,-28,-31,-15,-19,-21,-25,-43,-44,-35,-37,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,12,12,12,12,]),'SIMULATE':([0,2,3,4,5,6,7,8,9,10,17,18,19,20,22,24,26,27,28,30,32,33,34,35,37,39,41,42,43,44,45,46,47,50,51,53,55,57,58,60,61,62,63,64,76,78,89,93,94,97,98,99,100,101,102,104,105,106,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,],[13,13,-3,-4,-5,-6,-7,-8,-9,-10,-2,-74,-74,-74,-74,-11,-13,-29,-30,-14,-16,-17,-18,-73,-20,-24,-26,-68,-27,-32,-33,-34,-42,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,-36,-38,-61,-60,-62,-12,-28,-31,-15,-19,-21,-25,-43,-44,-35,-37,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,13,13,13,13,]),'BRANCH':([0,2,3,4,5,6,7,8,9,10,17,18,19,20,22,24,26,27,28,30,32,33,34,35,37,39,41,42,43,44,45,46,47,50,51,53,55,57,58,60,61,62,63,64,76,78,89,93,94,97,98,99,100,101,102,104,105,106,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,],[14,14,-3,-4,-5,-6,-7,-8,-9,-10,-2,-74,-74,-74,-74,-11,-13,-29,-30,-14,-16,-17,-18,-73,-20,-24,-26,-68,-27,-32,-33,-34,-42,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,-36,-38,-61,-60,-62,-12,-28,-31,-15,-19,-21,-25,-43,-44,-35,-37,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,14,14,14,14,]),'METADATA':([0,2,3,4,5,6,7,8,9,10,17,18,19,20,22,24,26,27,28,30,32,33,34,35,37,39,41,42,43,44,45,46,47,50,51,53,55,57,58,60,61,62,63,64,76,78,89,93,94,97,98,99,100,101,102,104,105,106,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,],[15,15,-3,-4,-5,-6,-7,-8,-9,-10,-2,-74,-74,-74,-74,-11,-13,-29,-30,-14,-16,-17,-18,-73,-20,-24,-26,-68,-27,-32,-33,-34,-42,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,-36,-38,-61,-60,-62,-12,-28,-31,-15,-19,-21,-25,-43,-44,-35,-37,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,15,15,15,15,]),'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,17,18,19,20,22,23,24,25,26,27,28,30,31,32,33,34,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,67,73,74,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,],[16,16,-3,-4,-5,-6,-7,-8,-9,-10,-2,29,29,29,29,42,-11,29,-13,-29,-30,-14,29,-16,-17,-18,-73,29,-20,-24,29,-26,-68,-27,-32,-33,-34,-42,29,42,-45,-52,42,-55,42,-59,42,-63,-65,42,-67,-69,-70,-71,-72,29,42,42,42,-36,-38,42,42,42,42,42,42,42,42,-61,42,42,42,-60,-62,42,-12,-28,-31,-15,-19,-21,42,-25,-43,-44,-35,-37,42,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,16,16,16,16,]),'$end':([0,1,2,3,4,5,6,7,8,9,10,17,18,19,20,22,24,26,27,28,30,32,33,34,35,37,39,41,42,43,44,45,46,47,50,51,53,55,57,58,60,61,62,63,64,76,78,89,93,94,97,98,99,100,101,102,104,105,106,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,],[-74,0,-1,-3,-4,-5,-6,-7,-8,-9,-10,-2,-74,-74,-74,-74,-11,-13,-29,-30,-14,-16,-17,-18,-73,-20,-24,-26,-68,-27,-32,-33,-34,-42,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,-36,-38,-61,-60,-62,-12,-28,-31,-15,-19,-21,-25,-43,-44,-35,-37,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,]),'ELSE':([3,4,5,6,7,8,9,10,17,18,19,20,22,24,26,27,28,30,32,33,34,35,37,39,41,42,43,44,45,46,47,50,51,53,55,57,58,60,61,62,63,64,76,78,89,93,94,97,98,99,100,101,102,104,105,106,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,],[-3,-4,-5,-6,-7,-8,-9,-10,-2,-74,-74,-74,-74,-11,-13,-29,-30,-14,-16,-17,-18,-73,-20,-24,-26,-68,-27,-32,-33,-34,-42,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,-36,-38,-61,-60,-62,-12,-28,-31,-15,-19,-21,-25,-43,-44,-35,-37,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,-74,127,]),'RBRACE':([3,4,5,6,7,8,9,10,17,18,19,20,22,24,25,26,27,28,30,31,32,33,34,35,36,37,39,40,41,42,43,44,45,46,47,48,50,51,53,55,57,58,60,61,62,63,64,65,68,69,70,72,75,76,78,89,93,94,97,98,99,100,101,102,104,105,106,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,125,126,128,129,],[-3,-4,-5,-6,-7,-8,-9,-10,-2,-74,-74,-74,-74,-11,-74,-13,-29,-30,-14,-74,-16,-17,-18,-73,-74,-20,-24,-74,-26,-68,-27,-32,-33,-34,-42,76,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,97,100,101,102,104,107,-36,-38,-61,-60,-62,-12,-28,-31,-15,-19,-21,-25,-43,-44,-35,-37,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,-74,-22,-74,-23,]),'COLON':([11,12,13,14,15,16,29,71,127,],[18,19,20,21,22,23,67,103,128,]),'LBRACE':([18,19,20,21,22,23,67,],[25,31,36,38,40,48,48,]),'COMMA':([18,19,20,22,25,26,27,28,31,32,35,36,37,40,41,42,44,45,46,47,48,49,50,51,53,55,57,58,60,61,62,63,64,65,68,69,72,75,76,77,78,79,80,89,93,94,98,99,105,106,107,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,],[-74,-74,-74,-74,-74,66,-29,-30,-74,66,-73,-74,66,-74,66,-68,-32,-33,-34,-42,-74,-74,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,66,66,66,66,66,-36,109,-38,-40,-41,-61,-60,-62,-28,-31,-43,-44,-35,-37,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,125,-39,]),'BOOLEAN':([20,23,49,52,54,56,59,67,73,74,81,82,83,84,85,86,87,88,90,91,92,95,103,109,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'LBRACKET':([23,67,],[49,49,]),'MINUS':([23,35,42,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,67,73,74,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,103,109,110,111,112,113,114,115,116,117,118,119,120,121,122,],[54,-73,-68,54,88,54,-55,54,-59,54,-63,-65,54,-67,-69,-70,-71,-72,54,54,54,54,54,54,54,54,54,54,54,-61,54,54,54,-60,-62,54,54,54,88,88,88,88,88,88,-53,-54,-56,-57,-58,-64,-66,]),'PLUS':([23,35,42,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,67,73,74,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,103,109,110,111,112,113,114,115,116,117,118,119,120,121,122,],[52,-73,-68,52,87,52,-55,52,-59,52,-63,-65,52,-67,-69,-70,-71,-72,52,52,52,52,52,52,52,52,52,52,52,-61,52,52,52,-60,-62,52,52,52,87,87,87,87,87,87,-53,-54,-56,-57,-58,-64,-66,]),'NOT':([23,49,52,54,56,59,67,73,74,81,82,83,84,85,86,87,88,90,91,92,95,103,109,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'LPAREN':([23,49,52,54,56,59,67,73,74,81,82,83,84,85,86,87,88,90,91,92,95,103,109,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'NUMBER':([23,49,52,54,56,59,67,73,74,81,82,83,84,85,86,87,88,90,91,92,95,103,109,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'STRING':([23,49,52,54,56,59,67,73,74,81,82,83,84,85,86,87,88,90,91,92,95,103,109,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'NULL':([23,49,52,54,56,59,67,73,74,81,82,83,84,85,86,87,88,90,91,92,95,103,109,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'POWER':([35,42,58,60,61,62,63,64,122,],[-73,-68,95,-67,-69,-70,-71,-72,-66,]),'TIMES':([35,42,53,55,57,58,60,61,62,63,64,89,93,94,116,117,118,119,120,121,122,],[-73,-68,90,-59,-63,-65,-67,-69,-70,-71,-72,-61,-60,-62,90,90,-56,-57,-58,-64,-66,]),'DIVIDE':([35,42,53,55,57,58,60,61,62,63,64,89,93,94,116,117,118,119,120,121,122,],[-73,-68,91,-59,-63,-65,-67,-69,-70,-71,-72,-61,-60,-62,91,91,-56,-57,-58,-64,-66,]),'MODULO':([35,42,53,55,57,58,60,61,62,63,64,89,93,94,116,117,118,119,120,121,122,],[-73,-68,92,-59,-63,-65,-67,-69,-70,-71,-72,-61,-60,-62,92,92,-56,-57,-58,-64,-66,]),'EQUALS':([35,42,51,53,55,57,58,60,61,62,63,64,89,93,94,116,117,118,119,120,121,122,],[-73,-68,81,-55,-59,-63,-65,-67,-69,-70,-71,-72,-61,-60,-62,-53,-54,-56,-57,-58,-64,-66,]),'NOT_EQUALS':([35,42,51,53,55,57,58,60,61,62,63,64,89,93,94,116,117,118,119,120,121,122,],[-73,-68,82,-55,-59,-63,-65,-67,-69,-70,-71,-72,-61,-60,-62,-53,-54,-56,-57,-58,-64,-66,]),'LESS_THAN':([35,42,51,53,55,57,58,60,61,62,63,64,89,93,94,116,117,118,119,120,121,122,],[-73,-68,83,-55,-59,-63,-65,-67,-69,-70,-71,-72,-61,-60,-62,-53,-54,-56,-57,-58,-64,-66,]),'GREATER_THAN':([35,42,51,53,55,57,58,60,61,62,63,64,89,93,94,116,117,118,119,120,121,122,],[-73,-68,84,-55,-59,-63,-65,-67,-69,-70,-71,-72,-61,-60,-62,-53,-54,-56,-57,-58,-64,-66,]),'LESS_EQUAL':([35,42,51,53,55,57,58,60,61,62,63,64,89,93,94,116,117,118,119,120,121,122,],[-73,-68,85,-55,-59,-63,-65,-67,-69,-70,-71,-72,-61,-60,-62,-53,-54,-56,-57,-58,-64,-66,]),'GREATER_EQUAL':([35,42,51,53,55,57,58,60,61,62,63,64,89,93,94,116,117,118,119,120,121,122,],[-73,-68,86,-55,-59,-63,-65,-67,-69,-70,-71,-72,-61,-60,-62,-53,-54,-56,-57,-58,-64,-66,]),'AND':([35,42,47,50,51,53,55,57,58,60,61,62,63,64,89,93,94,105,106,110,111,112,113,114,115,116,117,118,119,120,121,122,],[-73,-68,73,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,-61,-60,-62,-43,-44,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,]),'OR':([35,42,47,50,51,53,55,57,58,60,61,62,63,64,89,93,94,105,106,110,111,112,113,114,115,116,117,118,119,120,121,122,],[-73,-68,74,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,-61,-60,-62,-43,-44,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,]),'RBRACKET':([35,42,47,49,50,51,53,55,57,58,60,61,62,63,64,77,79,80,89,93,94,105,106,110,111,112,113,114,115,116,117,118,119,120,121,122,124,],[-73,-68,-42,78,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,108,-40,-41,-61,-60,-62,-43,-44,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,-39,]),'RPAREN':([35,42,47,50,51,53,55,57,58,60,61,62,63,64,89,93,94,96,105,106,110,111,112,113,114,115,116,117,118,119,120,121,122,],[-73,-68,-42,-45,-52,-55,-59,-63,-65,-67,-69,-70,-71,-72,-61,-60,-62,122,-43,-44,-46,-47,-48,-49,-50,-51,-53,-54,-56,-57,-58,-64,-66,]),'IF':([38,],[71,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,125,128,],[2,126,129,]),'statement':([0,2,125,126,128,129,],[3,17,3,17,3,17,]),'empty':([0,18,19,20,22,25,31,36,40,48,49,125,128,],[4,28,28,28,28,28,28,28,28,28,80,4,4,]),'experiment_statement':([0,2,125,126,128,129,],[5,5,5,5,5,5,]),'analyze_statement':([0,2,125,126,128,129,],[6,6,6,6,6,6,]),'simulate_statement':([0,2,125,126,128,129,],[7,7,7,7,7,7,]),'branch_statement':([0,2,125,126,128,129,],[8,8,8,8,8,8,]),'metadata_statement':([0,2,125,126,128,129,],[9,9,9,9,9,9,]),'assignment_statement':([0,2,125,126,128,129,],[10,10,10,10,10,10,]),'experiment_body':([18,],[24,]),'property_list':([18,19,20,22,25,31,36,40,48,],[26,32,37,41,65,68,69,72,75,]),'property':([18,19,20,22,25,31,36,40,48,66,],[27,27,27,27,27,27,27,27,27,98,]),'analyze_body':([19,],[30,]),'boolean_value':([20,23,49,52,54,56,59,67,73,74,81,82,83,84,85,86,87,88,90,91,92,95,103,109,],[33,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'simulate_body':([20,],[34,]),'metadata_body':([22,],[39,]),'value':([23,67,],[43,99,]),'expression':([23,49,59,67,103,109,],[44,79,96,44,123,124,]),'object_literal':([23,67,],[45,45,]),'array_literal':([23,67,],[46,46,]),'logical_expression':([23,49,59,67,103,109,],[47,47,47,47,47,47,]),'comparison_expression':([23,49,59,67,73,74,103,109,],[50,50,50,50,105,106,50,50,]),'arithmetic_expression':([23,49,59,67,73,74,81,82,83,84,85,86,103,109,],[51,51,51,51,51,51,110,111,112,113,114,115,51,51,]),'term':([23,49,59,67,73,74,81,82,83,84,85,86,87,88,103,109,],[53,53,53,53,53,53,53,53,53,53,53,53,116,117,53,53,]),'factor':([23,49,52,54,56,59,67,73,74,81,82,83,84,85,86,87,88,90,91,92,95,103,109,],[55,55,89,93,94,55,55,55,55,55,55,55,55,55,55,55,55,118,119,120,121,55,55,]),'power':([23,49,52,54,56,59,67,73,74,81,82,83,84,85,86,87,88,90,91,92,95,103,109,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'atom':([23,49,52,54,56,59,67,73,74,81,82,83,84,85,86,87,88,90,91,92,95,103,109,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'literal':([23,49,52,54,56,59,67,73,74,81,82,83,84,85,86,87,88,90,91,92,95,103,109,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'branch_body':([38,],[70,]),'expression_list':([49,],[77,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> statement_list','program',1,'p_program','grammar_parser.py',443),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','grammar_parser.py',451),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','grammar_parser.py',452),
+  ('statement_list -> empty','statement_list',1,'p_statement_list','grammar_parser.py',453),
+  ('statement -> experiment_statement','statement',1,'p_statement','grammar_parser.py',464),
+  ('statement -> analyze_statement','statement',1,'p_statement','grammar_parser.py',465),
+  ('statement -> simulate_statement','statement',1,'p_statement','grammar_parser.py',466),
+  ('statement -> branch_statement','statement',1,'p_statement','grammar_parser.py',467),
+  ('statement -> metadata_statement','statement',1,'p_statement','grammar_parser.py',468),
+  ('statement -> assignment_statement','statement',1,'p_statement','grammar_parser.py',469),
+  ('experiment_statement -> EXPERIMENT COLON experiment_body','experiment_statement',3,'p_experiment_statement','grammar_parser.py',473),
+  ('experiment_body -> LBRACE property_list RBRACE','experiment_body',3,'p_experiment_body','grammar_parser.py',481),
+  ('experiment_body -> property_list','experiment_body',1,'p_experiment_body','grammar_parser.py',482),
+  ('analyze_statement -> ANALYZE COLON analyze_body','analyze_statement',3,'p_analyze_statement','grammar_parser.py',489),
+  ('analyze_body -> LBRACE property_list RBRACE','analyze_body',3,'p_analyze_body','grammar_parser.py',493),
+  ('analyze_body -> property_list','analyze_body',1,'p_analyze_body','grammar_parser.py',494),
+  ('simulate_statement -> SIMULATE COLON boolean_value','simulate_statement',3,'p_simulate_statement','grammar_parser.py',501),
+  ('simulate_statement -> SIMULATE COLON simulate_body','simulate_statement',3,'p_simulate_statement','grammar_parser.py',502),
+  ('simulate_body -> LBRACE property_list RBRACE','simulate_body',3,'p_simulate_body','grammar_parser.py',506),
+  ('simulate_body -> property_list','simulate_body',1,'p_simulate_body','grammar_parser.py',507),
+  ('branch_statement -> BRANCH COLON LBRACE branch_body RBRACE','branch_statement',5,'p_branch_statement','grammar_parser.py',514),
+  ('branch_body -> IF COLON expression COMMA statement_list','branch_body',5,'p_branch_body','grammar_parser.py',518),
+  ('branch_body -> IF COLON expression COMMA statement_list ELSE COLON statement_list','branch_body',8,'p_branch_body','grammar_parser.py',519),
+  ('metadata_statement -> METADATA COLON metadata_body','metadata_statement',3,'p_metadata_statement','grammar_parser.py',526),
+  ('metadata_body -> LBRACE property_list RBRACE','metadata_body',3,'p_metadata_body','grammar_parser.py',530),
+  ('metadata_body -> property_list','metadata_body',1,'p_metadata_body','grammar_parser.py',531),
+  ('assignment_statement -> IDENTIFIER COLON value','assignment_statement',3,'p_assignment_statement','grammar_parser.py',546),
+  ('property_list -> property_list COMMA property','property_list',3,'p_property_list','grammar_parser.py',550),
+  ('property_list -> property','property_list',1,'p_property_list','grammar_parser.py',551),
+  ('property_list -> empty','property_list',1,'p_property_list','grammar_parser.py',552),
+  ('property -> IDENTIFIER COLON value','property',3,'p_property','grammar_parser.py',562),
+  ('value -> expression','value',1,'p_value','grammar_parser.py',566),
+  ('value -> object_literal','value',1,'p_value','grammar_parser.py',567),
+  ('value -> array_literal','value',1,'p_value','grammar_parser.py',568),
+  ('object_literal -> LBRACE property_list RBRACE','object_literal',3,'p_object_literal','grammar_parser.py',572),
+  ('object_literal -> LBRACE RBRACE','object_literal',2,'p_object_literal','grammar_parser.py',573),
+  ('array_literal -> LBRACKET expression_list RBRACKET','array_literal',3,'p_array_literal','grammar_parser.py',580),
+  ('array_literal -> LBRACKET RBRACKET','array_literal',2,'p_array_literal','grammar_parser.py',581),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list','grammar_parser.py',588),
+  ('expression_list -> expression','expression_list',1,'p_expression_list','grammar_parser.py',589),
+  ('expression_list -> empty','expression_list',1,'p_expression_list','grammar_parser.py',590),
+  ('expression -> logical_expression','expression',1,'p_expression','grammar_parser.py',600),
+  ('logical_expression -> logical_expression AND comparison_expression','logical_expression',3,'p_logical_expression','grammar_parser.py',604),
+  ('logical_expression -> logical_expression OR comparison_expression','logical_expression',3,'p_logical_expression','grammar_parser.py',605),
+  ('logical_expression -> comparison_expression','logical_expression',1,'p_logical_expression','grammar_parser.py',606),
+  ('comparison_expression -> arithmetic_expression EQUALS arithmetic_expression','comparison_expression',3,'p_comparison_expression','grammar_parser.py',610),
+  ('comparison_expression -> arithmetic_expression NOT_EQUALS arithmetic_expression','comparison_expression',3,'p_comparison_expression','grammar_parser.py',611),
+  ('comparison_expression -> arithmetic_expression LESS_THAN arithmetic_expression','comparison_expression',3,'p_comparison_expression','grammar_parser.py',612),
+  ('comparison_expression -> arithmetic_expression GREATER_THAN arithmetic_expression','comparison_expression',3,'p_comparison_expression','grammar_parser.py',613),
+  ('comparison_expression -> arithmetic_expression LESS_EQUAL arithmetic_expression','comparison_expression',3,'p_comparison_expression','grammar_parser.py',614),
+  ('comparison_expression -> arithmetic_expression GREATER_EQUAL arithmetic_expression','comparison_expression',3,'p_comparison_expression','grammar_parser.py',615),
+  ('comparison_expression -> arithmetic_expression','comparison_expression',1,'p_comparison_expression','grammar_parser.py',616),
+  ('arithmetic_expression -> arithmetic_expression PLUS term','arithmetic_expression',3,'p_arithmetic_expression','grammar_parser.py',620),
+  ('arithmetic_expression -> arithmetic_expression MINUS term','arithmetic_expression',3,'p_arithmetic_expression','grammar_parser.py',621),
+  ('arithmetic_expression -> term','arithmetic_expression',1,'p_arithmetic_expression','grammar_parser.py',622),
+  ('term -> term TIMES factor','term',3,'p_term','grammar_parser.py',626),
+  ('term -> term DIVIDE factor','term',3,'p_term','grammar_parser.py',627),
+  ('term -> term MODULO factor','term',3,'p_term','grammar_parser.py',628),
+  ('term -> factor','term',1,'p_term','grammar_parser.py',629),
+  ('factor -> MINUS factor','factor',2,'p_factor','grammar_parser.py',633),
+  ('factor -> PLUS factor','factor',2,'p_factor','grammar_parser.py',634),
+  ('factor -> NOT factor','factor',2,'p_factor','grammar_parser.py',635),
+  ('factor -> power','factor',1,'p_factor','grammar_parser.py',636),
+  ('power -> atom POWER factor','power',3,'p_power','grammar_parser.py',648),
+  ('power -> atom','power',1,'p_power','grammar_parser.py',649),
+  ('atom -> LPAREN expression RPAREN','atom',3,'p_atom','grammar_parser.py',653),
+  ('atom -> literal','atom',1,'p_atom','grammar_parser.py',654),
+  ('atom -> IDENTIFIER','atom',1,'p_atom','grammar_parser.py',655),
+  ('literal -> NUMBER','literal',1,'p_literal','grammar_parser.py',668),
+  ('literal -> STRING','literal',1,'p_literal','grammar_parser.py',669),
+  ('literal -> boolean_value','literal',1,'p_literal','grammar_parser.py',670),
+  ('literal -> NULL','literal',1,'p_literal','grammar_parser.py',671),
+  ('boolean_value -> BOOLEAN','boolean_value',1,'p_boolean_value','grammar_parser.py',682),
+  ('empty -> <empty>','empty',0,'p_empty','grammar_parser.py',686),
+]
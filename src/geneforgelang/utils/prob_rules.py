@@ -5,14 +5,44 @@
 
 
 class ProbRule:
-    """Simple likelihood-ratio rule used by the probabilistic reasoner."""
+    """Simple likelihood-ratio rule used by the probabilistic reasoner.
 
-    def __init__(self, name: str, lr: float, condition: Callable[[dict[str, Any]], bool]):
+    A rule with a ``node_type`` only applies to nodes of that type, which lets the
+    reasoner skip it for every other node without calling its condition. The
+    likelihood ratio ``lr`` must be positive; its log is kept in step with it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        lr: float,
+        condition: Callable[[dict[str, Any]], bool],
+        node_type: str | None = None,
+    ):
         self.name = name
         self.lr = lr
         self.condition = condition
+        self.node_type = node_type
+
+    @property
+    def lr(self) -> float:
+        return self._lr
+
+    @lr.setter
+    def lr(self, value: float) -> None:
+        if not value > 0:
+            raise ValueError(f"Likelihood ratio of rule {self.name!r} must be positive, got {value!r}")
+        self._lr = value
+        self._log_lr = math.log(value)
+
+    @property
+    def log_lr(self) -> float:
+        """Natural log of ``lr``, added to the log-odds when the rule fires."""
+        return self._log_lr
 
     def applies(self, node: dict[str, Any]) -> bool:
+        if self.node_type is not None and node.get("type") != self.node_type:
+            return False
         return bool(self.condition(node))
 
 
@@ -26,11 +56,21 @@ def __init__(self, rules: list[ProbRule], prior: float = 0.5):
     def posterior(self, ast: dict[str, Any]) -> dict[str, Any]:
         log_odds = math.log(self.prior / (1 - self.prior))
         fired: list[str] = []
+        # Rules that can apply to each node type, in rule order; built as types are seen
+        rules_by_type: dict[Any, list[ProbRule]] = {}
         for n in ast.get("children", []):
-            for r in self.rules:
+            node_type = n.get("type") if isinstance(n, dict) else None
+            if not isinstance(node_type, str):
+                # Only untyped rules can match nodes without a string type
+                node_type = None
+            rules = rules_by_type.get(node_type)
+            if rules is None:
+                rules = [r for r in self.rules if r.node_type is None or r.node_type == node_type]
+                rules_by_type[node_type] = rules
+            for r in rules:
                 try:
                     if r.applies(n):
-                        log_odds += math.log(r.lr)
+                        log_odds += r.log_lr
                         fired.append(r.name)
                 except Exception:
                     # Guard against malformed nodes
@@ -49,29 +89,25 @@ def default_rules() -> list[ProbRule]:
         ProbRule(
             "vector_tropism_match",
             3.0,
-            lambda n: n.get("type") == "vector"
-            and "tropism=retina" in str(n.get("attrs", {}).get("val", "")),
+            lambda n: "tropism=retina" in str(n.get("attrs", {}).get("val", "")),
+            node_type="vector",
         ),
         ProbRule(
             "non_equity_governance",
             0.5,
-            lambda n: (
-                n.get("type") == "governance"
-                and not any(
-                    k in str(n.get("attrs", {}).get("val", ""))
-                    for k in ("equity", "transparency", "stewardship")
-                )
+            lambda n: not any(
+                k in str(n.get("attrs", {}).get("val", ""))
+                for k in ("equity", "transparency", "stewardship")
             ),
+            node_type="governance",
         ),
         ProbRule(
             "high_offtarget",
             0.4,
-            lambda n: (
-                n.get("type") == "risk"
-                and _parse_float_after_colon(str(n.get("attrs", {}).get("val", "0:0"))) > 0.6
-            ),
+            lambda n: _parse_float_after_colon(str(n.get("attrs", {}).get("val", "0:0"))) > 0.6,
+            node_type="risk",
         ),
-        ProbRule("repeat_interruption", 4.0, lambda n: n.get("type") == "repeat_edit"),
+        ProbRule("repeat_interruption", 4.0, lambda n: True, node_type="repeat_edit"),
     ]
 
 
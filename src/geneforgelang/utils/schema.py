@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 from pathlib import Path
 from typing import Any, Union
@@ -21,6 +23,18 @@
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _read_schema_file(path: str, mtime: float) -> Any:
+    """Read and parse a schema file.
+
+    The modification time is part of the cache key, so editing a schema on disk
+    invalidates its entry. The cached content is shared, so callers must copy it
+    before handing any of it out.
+    """
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
 class SchemaDefinition:
     """Represents a schema definition loaded from a YAML file."""
 
@@ -141,9 +155,9 @@ def load_schema_file(
             return True
 
         try:
-            # Load YAML content
-            with open(file_path, encoding="utf-8") as f:
-                content = yaml.safe_load(f)
+            # Load YAML content (parsed once per file version across validations). Schema
+            # definitions keep references into it, so take a private copy of the cached data
+            content = copy.deepcopy(_read_schema_file(str(file_path), file_path.stat().st_mtime))
 
             if not isinstance(content, dict):
                 error = result.add_error(
@@ -1,5 +1,6 @@
 """Tests for enhanced inference engine and advanced ML model integration."""
 
+import sys
 import unittest
 from unittest.mock import patch
 
@@ -164,6 +165,20 @@ def test_heuristic_model_default_prediction(self):
         self.assertEqual(result.prediction, "unknown")
         self.assertEqual(result.confidence, 0.5)
 
+    def test_heuristic_model_deeply_nested_features(self):
+        """Test keywords are found in features nested past the recursion limit."""
+        if not HAS_ENHANCED_ENGINE:
+            self.skipTest("Enhanced inference engine not available")
+
+        model = HeuristicModel(ModelConfig(model_name="test_heuristic"))
+        features = {"tool": "CRISPR_cas9"}
+        for _ in range(sys.getrecursionlimit() + 100):
+            features = {"nested": features, "note": "Deep"}
+
+        result = model.predict(features)
+
+        self.assertEqual(result.prediction, "edited")
+
 
 @unittest.skipUnless(HAS_TORCH, "PyTorch not available")
 class TestTransformersModel(unittest.TestCase):
@@ -366,7 +381,7 @@ def test_legacy_engine_enhancement(self):
         """Test that legacy engine can use enhanced features."""
         # This test requires both old and new engines
         try:
-            from geneforgelang.cli.inference import InferenceEngine
+            from geneforgelang.core.inference import InferenceEngine
             from geneforgelang.models.dummy import DummyGeneModel
 
             # Create legacy engine with dummy model
@@ -401,6 +416,82 @@ def test_legacy_engine_enhancement(self):
         except ImportError:
             self.skipTest("Legacy inference engine not available")
 
+    def test_extract_features_shapes(self):
+        """Test feature extraction from YAML-style and legacy node-list ASTs."""
+        from geneforgelang.core.inference import InferenceEngine
+        from geneforgelang.models.dummy import DummyGeneModel
+
+        engine = InferenceEngine(DummyGeneModel())
+
+        features = engine._extract_features(
+            {
+                "experiment": {
+                    "tool": "CRISPR_cas9",
+                    "type": "gene_editing",
+                    "params": {"target_gene": "TP53"},
+                },
+                "analyze": {"strategy": "differential", "thresholds": {"p_value": 0.05}},
+            }
+        )
+        self.assertEqual(
+            features,
+            {
+                "experiment_tool": "CRISPR_cas9",
+                "experiment_type": "gene_editing",
+                "strategy": "differential",
+                "target_gene": "TP53",
+                "p_value": 0.05,
+                "simulate": False,
+            },
+        )
+
+        legacy = engine._extract_features(
+            {
+                "children": [
+                    {"type": "target", "attrs": {"val": "TP53"}},
+                    {"type": "other", "attrs": {"val": "ignored"}},
+                    "not-a-node",
+                ]
+            }
+        )
+        self.assertEqual(legacy, {"target": "TP53"})
+
+    def test_predict_effect_batch_matches_single(self):
+        """Test batch effect prediction matches per-AST prediction, in order."""
+        from geneforgelang.core.inference import InferenceEngine
+        from geneforgelang.models.dummy import DummyGeneModel
+
+        engine = InferenceEngine(DummyGeneModel())
+        asts = [
+            {"experiment": {"tool": "CRISPR_cas9", "type": "gene_editing"}},
+            {"children": [{"type": "repeat_edit", "attrs": {}}]},
+        ]
+
+        for enhanced in (True, False):
+            batch = engine.predict_effect_batch(asts, enhanced=enhanced)
+            single = [engine.predict_effect(ast, enhanced=enhanced) for ast in asts]
+            self.assertEqual(batch, single)
+
+    def test_engines_do_not_share_default_rules(self):
+        """Test changing one engine's rules leaves other engines untouched."""
+        from geneforgelang.core.inference import InferenceEngine
+        from geneforgelang.models.dummy import DummyGeneModel
+
+        first = InferenceEngine(DummyGeneModel())
+        second = InferenceEngine(DummyGeneModel())
+
+        self.assertIsNot(first.reasoner, second.reasoner)
+        self.assertIsNot(first.reasoner.rules, second.reasoner.rules)
+        self.assertEqual(
+            [rule.name for rule in first.reasoner.rules],
+            [rule.name for rule in second.reasoner.rules],
+        )
+
+        original_lr = second.reasoner.rules[-1].lr
+        first.reasoner.rules[-1].lr = 1.0
+        self.assertEqual(second.reasoner.rules[-1].lr, original_lr)
+        self.assertEqual(InferenceEngine(DummyGeneModel()).reasoner.rules[-1].lr, original_lr)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -19,11 +19,13 @@
     OptimizationStrategy,
     OptimizerPlugin,
     SequenceGeneratorPlugin,
+    find_optimizer_for_strategy,
     get_available_generators,
     get_available_optimizers,
     register_generator_plugin,
     register_optimizer_plugin,
 )
+from geneforgelang.plugins.plugin_registry import plugin_registry
 from geneforgelang.utils.example_implementations import (
     BayesianOptimizer,
     MoleculeTransformerGenerator,
@@ -654,6 +656,36 @@ def test_bayesian_optimizer_implementation(self):
         assert isinstance(step, OptimizationStep)
         assert "param1" in step.parameters
 
+        # Acquisition and uncertainty paths need some history
+        history = [
+            ExperimentResult({"param1": 0.1}, 0.2),
+            ExperimentResult({"param1": 0.5}, 0.6),
+            ExperimentResult({"param1": 0.9}, 0.4),
+        ]
+        step = optimizer.suggest_next(history)
+        assert 0.0 <= step.parameters["param1"] <= 1.0
+        assert 0.0 < step.uncertainty <= 1.0
+
+        steps = optimizer.suggest_batch(history, 3)
+        assert len(steps) == 3
+        assert [s.iteration for s in steps] == [step.iteration + i for i in (1, 2, 3)]
+
+    def test_bayesian_optimizer_batch_sampling(self):
+        """Test batched candidate sampling respects the search space."""
+        optimizer = BayesianOptimizer()
+        optimizer.setup(
+            search_space={"temp": "range(30, 40)", "enzyme": "choice(['a', 'b'])"},
+            strategy={"name": "BayesianOptimization"},
+            objective={"maximize": "efficiency"},
+            budget={"max_experiments": 10},
+        )
+
+        candidates = optimizer._sample_random_parameter_batch(5)
+        assert len(candidates) == 5
+        for candidate in candidates:
+            assert 30 <= candidate["temp"] <= 40
+            assert candidate["enzyme"] in ("a", "b")
+
 
 class TestPluginRegistration:
     """Test plugin registration utilities."""
@@ -697,3 +729,26 @@ def test_get_available_plugins(self):
 
         assert isinstance(generators, dict)
         assert isinstance(optimizers, dict)
+
+    def test_available_plugins_cache_follows_registry_version(self):
+        """Test cached plugin lookups are rebuilt only when the registry changes."""
+        register_generator_plugin(MockGeneratorPlugin, "test_gen", version="1.0.0")
+        assert "mock_generator" in get_available_generators()
+
+        version = plugin_registry.version
+        assert "mock_generator" in get_available_generators()
+        assert plugin_registry.version == version
+
+        plugin_registry.unload_plugin("mock_generator")
+        assert "mock_generator" not in get_available_generators()
+
+    def test_find_optimizer_for_strategy(self):
+        """Test strategy lookups go through the registry-versioned index."""
+        register_optimizer_plugin(MockOptimizerPlugin, "test_opt", version="1.0.0")
+
+        optimizer = find_optimizer_for_strategy("RandomSearch")
+        assert isinstance(optimizer, MockOptimizerPlugin)
+        assert find_optimizer_for_strategy("no_such_strategy") is None
+
+        plugin_registry.unload_plugin("mock_optimizer")
+        assert find_optimizer_for_strategy("RandomSearch") is None
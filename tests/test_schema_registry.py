@@ -110,3 +110,38 @@ def test_simple_schema_usage():
     print(f"Simple validation result: {'Valid' if result.is_valid else 'Invalid'}")
     assert result, "Expected simple schema usage to be valid"
     assert result.errors, "Expected validation errors due to schema issues, but got none"
+
+
+def test_schema_file_parse_is_cached(tmp_path):
+    """Reloading an unchanged schema file reuses the parsed content."""
+    from geneforgelang.utils.schema import _read_schema_file
+
+    schema_file = tmp_path / "types.yml"
+    schema_file.write_text("schemas:\n  Reads:\n    type: FASTQ\n", encoding="utf-8")
+
+    _read_schema_file.cache_clear()
+    for _ in range(3):
+        loader = SchemaLoader()
+        assert loader.load_schema_file(schema_file, EnhancedValidationResult())
+        assert loader.get_schema("Reads").base_type == "FASTQ"
+
+    info = _read_schema_file.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+def test_cached_schema_content_is_not_shared(tmp_path):
+    """Changes to a loaded schema do not leak into later loads of the same file."""
+    schema_file = tmp_path / "types.yml"
+    schema_file.write_text(
+        "schemas:\n  Reads:\n    type: FASTQ\n    attributes:\n      paired:\n        type: bool\n",
+        encoding="utf-8",
+    )
+
+    first = SchemaLoader()
+    assert first.load_schema_file(schema_file, EnhancedValidationResult())
+    first.get_schema("Reads").attributes["paired"]["type"] = "int"
+
+    second = SchemaLoader()
+    assert second.load_schema_file(schema_file, EnhancedValidationResult())
+    assert second.get_schema("Reads").attributes == {"paired": {"type": "bool"}}
@@ -148,6 +148,19 @@ def test_process_with_plugins(self):
         assert result["processed_by_plugin2"]
         assert result["original"]
 
+    def test_process_with_plugins_tracks_activation(self):
+        """Test processing follows plugins being activated and deactivated."""
+        plugin_registry.register("first", MockPlugin("first"))
+        plugin_registry.register("second", MockPlugin("second"))
+        activate_plugin("first")
+        assert "processed_by_second" not in process_with_plugins({})
+
+        activate_plugin("second")
+        assert process_with_plugins({})["processed_by_second"]
+
+        plugin_registry.deactivate_plugin("first")
+        assert "processed_by_first" not in process_with_plugins({})
+
     def test_validate_plugin_dependencies(self):
         """Test plugin dependency validation."""
         # Plugin with missing dependency
@@ -193,6 +206,17 @@ def test_get_plugins_by_state(self):
         assert active_plugins[0].name == "plugin1"
         assert loaded_plugins[0].name == "plugin2"
 
+    def test_get_active_plugin_does_not_reload(self):
+        """Test fetching an active plugin returns it without reloading."""
+        mock_plugin = MockPlugin("active")
+        plugin_registry.register("active", mock_plugin)
+        activate_plugin("active")
+        mock_plugin.load_called = False
+
+        assert plugin_registry.get("active") is mock_plugin
+        assert not mock_plugin.load_called
+        assert plugin_registry.get_plugins_by_state(PluginState.ACTIVE)[0].name == "active"
+
 
 class TestPluginErrorHandling:
     """Test error handling in plugin system."""
@@ -220,6 +220,18 @@ def test_error_categorization(self):
         assert not result.is_valid  # Has critical and semantic errors
         assert result.has_warnings
 
+    def test_is_valid_respects_explicit_error_lists(self):
+        """Test is_valid honours syntax/semantic overrides set after construction."""
+        result = EnhancedValidationResult()
+        result.add_error("Syntax", "S001", category=ErrorCategory.SYNTAX)
+        assert not result.is_valid
+
+        result.syntax_errors = []
+        assert result.is_valid
+
+        result.semantic_errors = [create_semantic_error("Bad")]
+        assert not result.is_valid
+
     def test_get_errors_by_category(self):
         """Test getting errors by category."""
         result = EnhancedValidationResult()
@@ -1,7 +1,10 @@
 """Tests for performance optimization module."""
 
+import datetime
 import time
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
 
 import pytest
 
@@ -11,6 +14,7 @@
     LRUEvictionPolicy,
     PerformanceMonitor,
     PerformanceOptimizer,
+    _create_cache_key,
     cached,
     get_monitor,
     get_optimizer,
@@ -18,6 +22,20 @@
 )
 
 
+class Strand(str, Enum):
+    FORWARD = "forward"
+
+
+@dataclass
+class Gene:
+    name: str
+
+
+@dataclass
+class Protein:
+    name: str
+
+
 class TestIntelligentCache:
     """Test intelligent cache functionality."""
 
@@ -229,6 +247,41 @@ def expensive_function(x: int, y: int = 10) -> int:
         assert result3 == 25
         assert call_count == 2
 
+    def test_cached_function_with_nested_arguments(self):
+        """Test caching keyed on nested dict arguments and unserializable objects."""
+        call_count = 0
+
+        @cached(cache_name="nested_args_cache", max_size=10)
+        def summarize(ast: dict, marker: object = None) -> int:
+            nonlocal call_count
+            call_count += 1
+            return len(ast["experiment"]["params"])
+
+        ast = {"experiment": {"tool": "CRISPR_cas9", "params": {"target_gene": "TP53"}}}
+        same_ast = {"experiment": {"tool": "CRISPR_cas9", "params": {"target_gene": "TP53"}}}
+        assert summarize(ast) == 1
+        assert summarize(same_ast) == 1
+        assert call_count == 1
+
+        # Arguments that are not JSON-serializable still produce stable keys
+        marker = {1, 2}
+        assert summarize(ast, marker) == 1
+        assert summarize(ast, marker) == 1
+        assert call_count == 2
+
+    def test_cache_key_distinguishes_json_lookalikes(self):
+        """Test arguments that encode to the same JSON still get distinct keys."""
+        lookalikes = [
+            ((1, 2), [1, 2]),
+            (Strand.FORWARD, "forward"),
+            (Gene("TP53"), Protein("TP53")),
+            (datetime.date(2024, 1, 1), "2024-01-01"),
+            (float("nan"), None),
+        ]
+        for first, second in lookalikes:
+            assert _create_cache_key("f", (first,), {}) != _create_cache_key("f", (second,), {})
+            assert _create_cache_key("f", (), {"x": first}) != _create_cache_key("f", (), {"x": second})
+
     def test_cached_function_with_optimizer_disabled(self):
         """Test cached function when optimizer is disabled."""
         optimizer = get_optimizer()
@@ -312,6 +365,18 @@ def test_multiple_operations(self):
         assert stats["count"] == 3
         assert stats["total"] >= 0.003  # At least 3ms total
 
+    def test_metrics_keep_recent_window(self):
+        """Test only the most recent 1000 measurements are kept."""
+        monitor = PerformanceMonitor()
+
+        for i in range(1005):
+            monitor.record_metric("window_op", float(i))
+
+        stats = monitor.get_stats("window_op")
+        assert stats["count"] == 1000
+        assert stats["min"] == 5.0
+        assert stats["max"] == 1004.0
+
     def test_monitor_disabled(self):
         """Test monitoring when disabled."""
         monitor = PerformanceMonitor()
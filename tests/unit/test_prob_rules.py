@@ -0,0 +1,60 @@
+"""Unit tests for the probabilistic rule layer."""
+
+import pytest
+
+from geneforgelang.utils.prob_rules import ProbReasoner, ProbRule, default_rules
+
+
+class TestProbReasoner:
+    """Test rule firing and posterior aggregation."""
+
+    def test_default_rules_fire_by_node_type(self):
+        """Test each default rule fires only on nodes of its type."""
+        reasoner = ProbReasoner(default_rules())
+        ast = {
+            "children": [
+                {"type": "vector", "attrs": {"val": "AAV tropism=retina"}},
+                {"type": "target", "attrs": {"val": "tropism=retina"}},
+                {"type": "repeat_edit", "attrs": {}},
+                "not-a-node",
+            ]
+        }
+
+        post = reasoner.posterior(ast)
+
+        assert post["fired_rules"] == ["vector_tropism_match", "repeat_interruption"]
+        assert post["confidence"] == 0.92
+
+    def test_untyped_rules_apply_to_every_node(self):
+        """Test a rule without a node type is checked against all nodes."""
+        calls = []
+        rule = ProbRule("any", 2.0, lambda n: calls.append(n) or True)
+        typed = ProbRule("typed", 2.0, lambda n: calls.append(n) or True, node_type="risk")
+
+        post = ProbReasoner([rule, typed]).posterior({"children": [{"type": "x"}, {}]})
+
+        assert post["fired_rules"] == ["any", "any"]
+        assert len(calls) == 2
+
+    def test_updating_lr_changes_posterior(self):
+        """Test a rule's likelihood ratio can be changed after construction."""
+        rule = ProbRule("always", 4.0, lambda n: True)
+        reasoner = ProbReasoner([rule])
+        ast = {"children": [{"type": "x"}]}
+        assert reasoner.posterior(ast)["confidence"] == 0.8
+
+        rule.lr = 1.0
+
+        assert rule.log_lr == 0.0
+        assert reasoner.posterior(ast)["confidence"] == 0.5
+
+    @pytest.mark.parametrize("lr", [0.0, -1.0, float("nan")])
+    def test_non_positive_lr_is_rejected(self, lr):
+        """Test rules need a positive likelihood ratio."""
+        with pytest.raises(ValueError, match="must be positive"):
+            ProbRule("bad", lr, lambda n: True)
+
+        rule = ProbRule("good", 2.0, lambda n: True)
+        with pytest.raises(ValueError, match="must be positive"):
+            rule.lr = lr
+        assert rule.lr == 2.0